@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import asyncio
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import click
 from dotenv import load_dotenv
 
-from hackathon_reviewer.config import ReviewConfig, load_config
+if TYPE_CHECKING:
+    from hackathon_reviewer.config import ReviewConfig
 
 load_dotenv()
 
 
 def _build_config(csv: str | None, config: str | None, output: str) -> ReviewConfig:
     """Load YAML config and merge CLI args."""
+    # Imported here so `--help` / `--version` don't pay for pydantic + yaml.
+    from hackathon_reviewer.config import load_config
+
     cfg = load_config(config)
     if csv:
         cfg.csv_path = Path(csv)
@@ -23,6 +29,84 @@ def _build_config(csv: str | None, config: str | None, output: str) -> ReviewCon
     return cfg
 
 
+async def _run_branches(cfg: ReviewConfig, submissions: list, resume: bool) -> tuple:
+    """Run the repo and video branches of the pipeline concurrently.
+
+    The repo branch (clone -> static analysis -> code review) and the video
+    branch (download -> video analysis) share no inputs beyond the parsed
+    submissions, and both are dominated by network / LLM latency, so
+    overlapping them cuts wall-clock to roughly the slower of the two.
+    Within the video branch, analysis also starts on each video as soon as
+    it has downloaded.
+    """
+    import queue
+    from concurrent.futures import ThreadPoolExecutor
+
+    from hackathon_reviewer.stages.clone import run_clone
+    from hackathon_reviewer.stages.video import run_video_download
+    from hackathon_reviewer.stages.static_analysis import run_static_analysis
+    from hackathon_reviewer.stages.code_review import run_code_review
+    from hackathon_reviewer.stages.video_analysis import run_video_analysis
+
+    def _repo_branch():
+        repo_metadata = run_clone(cfg, submissions, resume=resume)
+        static_results = run_static_analysis(cfg, submissions, repo_metadata)
+        code_reviews = run_code_review(cfg, submissions, repo_metadata, static_results, resume=resume)
+        return repo_metadata, static_results, code_reviews
+
+    def _video_branch():
+        # Stream each finished download straight into analysis instead of
+        # waiting for the slowest one. None marks the end of the stream; an
+        # exception means the download stage crashed, and is re-raised inside
+        # analysis so it aborts instead of failing every remaining team.
+        arrivals: queue.SimpleQueue = queue.SimpleQueue()
+
+        def _download():
+            try:
+                video_downloads = run_video_download(
+                    cfg, submissions, resume=resume,
+                    on_result=lambda team_num, result: arrivals.put((team_num, result)),
+                )
+            except BaseException as e:
+                arrivals.put(e)
+                raise
+            arrivals.put(None)
+            return video_downloads
+
+        def _stream():
+            while (item := arrivals.get()) is not None:
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            downloading = pool.submit(_download)
+            video_results = run_video_analysis(cfg, submissions, _stream(), resume=resume)
+            video_downloads = downloading.result()
+        return video_downloads, video_results
+
+    (repo_metadata, static_results, code_reviews), (_, video_results) = await asyncio.gather(
+        asyncio.to_thread(_repo_branch),
+        asyncio.to_thread(_video_branch),
+    )
+    return repo_metadata, static_results, code_reviews, video_results
+
+
+_csv_option = click.option(
+    "--csv", required=True, type=click.Path(exists=True), help="Path to submissions CSV.",
+)
+
+
+def _common_options(f):
+    """`--config` / `--output`, shared by every subcommand."""
+    f = click.option("--output", default="./output", help="Output directory.")(f)
+    return click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")(f)
+
+
+def _resume_option(help: str):
+    return click.option("--resume/--no-resume", default=True, help=help)
+
+
 @click.group()
 @click.version_option(package_name="hackathon-reviewer")
 def main():
@@ -31,20 +115,14 @@ def main():
 
 
 @main.command()
-@click.option("--csv", required=True, type=click.Path(exists=True), help="Path to submissions CSV.")
-@click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")
-@click.option("--output", default="./output", help="Output directory.")
-@click.option("--resume/--no-resume", default=True, help="Skip already-completed work.")
+@_csv_option
+@_common_options
+@_resume_option("Skip already-completed work.")
 def run(csv: str, config: str | None, output: str, resume: bool):
     """Run the full review pipeline."""
     cfg = _build_config(csv, config, output)
 
     from hackathon_reviewer.stages.parse import run_parse
-    from hackathon_reviewer.stages.clone import run_clone
-    from hackathon_reviewer.stages.video import run_video_download
-    from hackathon_reviewer.stages.static_analysis import run_static_analysis
-    from hackathon_reviewer.stages.code_review import run_code_review
-    from hackathon_reviewer.stages.video_analysis import run_video_analysis
     from hackathon_reviewer.stages.scoring import run_scoring
     from hackathon_reviewer.stages.reporting import run_reporting
 
@@ -53,11 +131,9 @@ def run(csv: str, config: str | None, output: str, resume: bool):
     click.echo("=" * 60)
 
     submissions = run_parse(cfg)
-    repo_metadata = run_clone(cfg, submissions, resume=resume)
-    video_downloads = run_video_download(cfg, submissions, resume=resume)
-    static_results = run_static_analysis(cfg, submissions, repo_metadata)
-    code_reviews = run_code_review(cfg, submissions, repo_metadata, static_results, resume=resume)
-    video_results = run_video_analysis(cfg, submissions, video_downloads, resume=resume)
+    repo_metadata, static_results, code_reviews, video_results = asyncio.run(
+        _run_branches(cfg, submissions, resume)
+    )
     scores = run_scoring(cfg, submissions, repo_metadata, static_results, code_reviews, video_results)
     run_reporting(cfg, submissions, repo_metadata, static_results, code_reviews, video_results, scores)
 
@@ -67,9 +143,8 @@ def run(csv: str, config: str | None, output: str, resume: bool):
 
 
 @main.command()
-@click.option("--csv", required=True, type=click.Path(exists=True), help="Path to submissions CSV.")
-@click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")
-@click.option("--output", default="./output", help="Output directory.")
+@_csv_option
+@_common_options
 def parse(csv: str, config: str | None, output: str):
     """Parse the submissions CSV into structured JSON."""
     cfg = _build_config(csv, config, output)
@@ -78,9 +153,8 @@ def parse(csv: str, config: str | None, output: str):
 
 
 @main.command()
-@click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")
-@click.option("--output", default="./output", help="Output directory.")
-@click.option("--resume/--no-resume", default=True, help="Skip already-cloned repos.")
+@_common_options
+@_resume_option("Skip already-cloned repos.")
 def clone(config: str | None, output: str, resume: bool):
     """Clone all GitHub repositories."""
     cfg = _build_config(None, config, output)
@@ -91,10 +165,9 @@ def clone(config: str | None, output: str, resume: bool):
 
 
 @main.command()
-@click.option("--csv", required=True, type=click.Path(exists=True), help="Path to submissions CSV.")
-@click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")
-@click.option("--output", default="./output", help="Output directory.")
-@click.option("--resume/--no-resume", default=True, help="Skip already-downloaded videos.")
+@_csv_option
+@_common_options
+@_resume_option("Skip already-downloaded videos.")
 def download(csv: str, config: str | None, output: str, resume: bool):
     """Download all demo videos."""
     cfg = _build_config(csv, config, output)
@@ -105,9 +178,8 @@ def download(csv: str, config: str | None, output: str, resume: bool):
 
 
 @main.command()
-@click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")
-@click.option("--output", default="./output", help="Output directory.")
-@click.option("--resume/--no-resume", default=True, help="Skip already-completed work.")
+@_common_options
+@_resume_option("Skip already-completed work.")
 def analyze(config: str | None, output: str, resume: bool):
     """Run code review and video analysis (requires parse, clone, download first)."""
     cfg = _build_config(None, config, output)
@@ -127,8 +199,7 @@ def analyze(config: str | None, output: str, resume: bool):
 
 
 @main.command()
-@click.option("--config", default=None, type=click.Path(exists=True), help="Path to config YAML.")
-@click.option("--output", default="./output", help="Output directory.")
+@_common_options
 def report(config: str | None, output: str):
     """Generate reports from existing analysis data."""
     cfg = _build_config(None, config, output)
@@ -137,7 +208,7 @@ def report(config: str | None, output: str):
     from hackathon_reviewer.stages.static_analysis import load_static_analysis
     from hackathon_reviewer.stages.code_review import load_code_reviews
     from hackathon_reviewer.stages.video_analysis import load_video_analysis
-    from hackathon_reviewer.stages.scoring import run_scoring, load_scores
+    from hackathon_reviewer.stages.scoring import run_scoring, load_fresh_scores
     from hackathon_reviewer.stages.reporting import run_reporting
 
     submissions = load_submissions(cfg)
@@ -145,5 +216,9 @@ def report(config: str | None, output: str):
     static_results = load_static_analysis(cfg)
     code_reviews = load_code_reviews(cfg)
     video_results = load_video_analysis(cfg)
-    scores = run_scoring(cfg, submissions, repo_metadata, static_results, code_reviews, video_results)
+    scores = load_fresh_scores(cfg)
+    if scores is None:
+        scores = run_scoring(cfg, submissions, repo_metadata, static_results, code_reviews, video_results)
+    else:
+        click.echo(f"\n--- Stage 7: Scoring ---\n  Inputs unchanged, reusing {len(scores)} saved scores")
     run_reporting(cfg, submissions, repo_metadata, static_results, code_reviews, video_results, scores)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -32,6 +33,18 @@ class CodeReviewConfig(BaseModel):
     model: str = "claude-opus-4-6"
     max_tokens: int = 2000
     max_source_chars: int = 20000
+    # Hard ceiling on the whole rendered prompt, estimated at ~4 chars per
+    # token. Source files are trimmed first, then the transcript.
+    max_prompt_tokens: int = 12000
+    # Per-request bounds, so a hung call frees its worker slot instead of
+    # holding it for the SDK default (10 minutes for Anthropic). Timed-out
+    # reviews are recorded with error "timeout" and re-run on --resume.
+    request_timeout_s: float = 120
+    max_retries: int = 3
+    # Submit all reviews as one provider batch job (Anthropic Message
+    # Batches, Gemini Batch API) instead of one request per team. Cheaper,
+    # but results only arrive once the whole batch has finished.
+    batch_api: bool = False
     prompt_preamble: str = ""
     review_sections: list[ReviewSection] = Field(default_factory=list)
 
@@ -81,9 +94,17 @@ class ScoringConfig(BaseModel):
 
 
 class ConcurrencyConfig(BaseModel):
-    clone_workers: int = 4
+    clone_workers: int = 16
     video_download_workers: int = 4
+    static_analysis_workers: int = 0  # 0 = one process per CPU
+    video_prep_workers: int = 0  # concurrent ffmpeg re-encodes; 0 = half the CPUs
     llm_concurrent_requests: int = 3
+    # Proactive per-minute budgets for code review calls (0 = unlimited).
+    # Requests wait for budget instead of tripping provider 429s.
+    llm_requests_per_minute: int = 0
+    llm_input_tokens_per_minute: int = 0
+    # Same idea for Gemini video analysis requests (0 = unlimited).
+    video_requests_per_minute: int = 0
 
 
 class ReviewConfig(BaseModel):
@@ -122,6 +143,18 @@ class ReviewConfig(BaseModel):
     def cache_dir(self) -> Path | None:
         return self.cache_dir_override
 
+    @property
+    def prompt_cache_dir(self) -> Path:
+        """Content-addressed LLM response cache (see utils.llm_cache.PromptCache).
+
+        Unlike `cache_dir` this is on in CLI mode too, under
+        `<output_dir>/cache`. Entries are keyed by the rendered provider
+        request, so a prompt or config change misses; `--no-resume` skips
+        lookups to force fresh reviews. Nothing is evicted, so delete the
+        directory to reclaim space.
+        """
+        return self.cache_dir or (self.output_dir / "cache")
+
     @property
     def data_dir(self) -> Path:
         return self.output_dir / "data"
@@ -154,7 +187,10 @@ class ReviewConfig(BaseModel):
         if self.cache_dir is not None:
             dirs.append(self.cache_dir)
         for d in dirs:
-            d.mkdir(parents=True, exist_ok=True)
+            # One stat for the common (already exists) case instead of a
+            # mkdir syscall per directory.
+            if not d.is_dir():
+                d.mkdir(parents=True, exist_ok=True)
 
 
 def load_config(config_path: str | Path | None = None) -> ReviewConfig:
@@ -162,10 +198,18 @@ def load_config(config_path: str | Path | None = None) -> ReviewConfig:
     if config_path is None:
         return ReviewConfig()
 
-    path = Path(config_path)
+    path = Path(config_path).resolve()
     if not path.exists():
         raise FileNotFoundError(f"Config file not found: {path}")
 
+    # Callers mutate the returned config (csv_path, output_dir, ...), so
+    # hand out a copy of the cached parse rather than the shared instance.
+    return _load_config_cached(path, path.stat().st_mtime_ns).model_copy(deep=True)
+
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path: Path, mtime_ns: int) -> ReviewConfig:
+    """Parse + validate a config file; keyed on mtime so edits are picked up."""
     with open(path, "r", encoding="utf-8") as f:
         raw = yaml.safe_load(f) or {}
 
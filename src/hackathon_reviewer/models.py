@@ -135,6 +135,8 @@ class GitHistory(BaseModel):
 
 class RepoFiles(BaseModel):
     file_count: int = 0
+    # Non-blank lines. Files over clone.MAX_LOC_READ_BYTES are estimated
+    # from their first MAX_LOC_READ_BYTES bytes, scaled by file size.
     total_loc: int = 0
     primary_language: str = "unknown"
     languages: dict[str, int] = Field(default_factory=dict)
@@ -150,6 +152,7 @@ class RepoMetadata(BaseModel):
     sanitized_name: str
     clone_success: bool = False
     clone_error: str | None = None
+    head_sha: str | None = None
     files: RepoFiles = Field(default_factory=RepoFiles)
     git_history: GitHistory = Field(default_factory=GitHistory)
 
@@ -207,6 +210,7 @@ class CodeReviewResult(BaseModel):
     model_used: str = ""
     input_tokens: int = 0
     output_tokens: int = 0
+    truncated: bool = False  # the reviewer saw source / transcript cut to fit the prompt budget
 
 
 # ---------------------------------------------------------------------------
@@ -218,6 +222,7 @@ class VideoDownloadResult(BaseModel):
     error: str | None = None
     method: str = ""
     file_path: str | None = None
+    file_size: int = 0  # bytes on disk when duration_seconds was probed
     duration_seconds: float = 0.0
 
 
@@ -2,36 +2,149 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from functools import lru_cache
+
 from hackathon_reviewer.providers.base import (
+    BatchGone,
     CodeReviewContext,
     CodeReviewResponse,
     LLMProvider,
+    ScoringCriterionDef,
+    error_text,
 )
 from hackathon_reviewer.providers.prompts import (
     DEFAULT_CRITERIA,
-    build_code_review_prompt,
+    build_code_review_instructions,
+    build_code_review_submission,
     parse_scores,
 )
 
+# Message Batches polling backs off from the min to the max interval (seconds).
+BATCH_POLL_MIN_INTERVAL = 5
+BATCH_POLL_INTERVAL = 60
+# HTTP statuses meaning a saved batch id will never be collectable.
+BATCH_GONE_STATUS = {401, 403, 404}
+
+
+def _request_params(
+    ctx: CodeReviewContext,
+    criteria: list[ScoringCriterionDef],
+    model: str,
+    max_tokens: int,
+) -> dict:
+    """Messages API params with the shared instructions as a system block.
+
+    The instructions are identical across submissions, so the block carries
+    a `cache_control` marker. Anthropic ignores the marker below the model's
+    minimum cacheable prompt length: 1,024 tokens, or 4,096 on the Opus
+    models such as the default `claude-opus-4-6`. The default rubric renders
+    to about 350 tokens, so only a much longer custom rubric gets cache
+    reads. `usage.cache_read_input_tokens` shows whether it did.
+    """
+    return {
+        "model": model,
+        "max_tokens": max_tokens,
+        "system": [{
+            "type": "text",
+            "text": build_code_review_instructions(ctx, criteria),
+            "cache_control": {"type": "ephemeral"},
+        }],
+        "messages": [{"role": "user", "content": build_code_review_submission(ctx)}],
+    }
+
+
+def _custom_ids(contexts: list[CodeReviewContext], request_ids: list[str] | None) -> list[str]:
+    if request_ids is not None:
+        return list(request_ids)
+    return [f"team-{ctx.team_number}" for ctx in contexts]
+
+
+def _client_options(timeout_s: float | None, max_retries: int | None) -> dict:
+    """SDK constructor kwargs; None leaves the SDK default in place."""
+    options: dict = {}
+    if timeout_s is not None:
+        options["timeout"] = timeout_s
+    if max_retries is not None:
+        options["max_retries"] = max_retries
+    return options
+
+
+@lru_cache(maxsize=4)
+def _client(api_key: str, timeout_s: float | None = None, max_retries: int | None = None):
+    """One SDK client (and so one httpx connection pool) per API key.
+
+    Stages and retries build a fresh provider each time; sharing the client
+    lets them reuse warm keep-alive connections instead of re-handshaking.
+    The SDK client is thread-safe, so worker threads can share it too.
+    """
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key, **_client_options(timeout_s, max_retries))
+
 
 class AnthropicProvider(LLMProvider):
-    def __init__(self, api_key: str, model: str = "claude-opus-4-6", max_tokens: int = 2000):
-        import anthropic
-        self.client = anthropic.Anthropic(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "claude-opus-4-6",
+        max_tokens: int = 2000,
+        timeout_s: float | None = None,
+        max_retries: int | None = None,
+    ):
+        self.client = _client(api_key, timeout_s, max_retries)
+        self.api_key = api_key
         self.model = model
         self.max_tokens = max_tokens
+        self.client_options = _client_options(timeout_s, max_retries)
+        self._aclient = None
+        self._aclient_loop = None
 
-    def review_code(self, ctx: CodeReviewContext) -> CodeReviewResponse:
+    def _async_client(self):
+        """AsyncAnthropic bound to the running loop.
+
+        httpx async pools can't outlive the loop that created them, so a new
+        client is made whenever the stage starts a fresh `asyncio.run`.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            import anthropic
+            self._aclient = anthropic.AsyncAnthropic(api_key=self.api_key, **self.client_options)
+            self._aclient_loop = loop
+        return self._aclient
+
+    def code_review_request(self, ctx: CodeReviewContext) -> dict:
         criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
-        prompt = build_code_review_prompt(ctx, criteria)
+        return _request_params(ctx, criteria, self.model, self.max_tokens)
 
+    def review_code(self, ctx: CodeReviewContext) -> CodeReviewResponse:
+        criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
         try:
-            response = self.client.messages.create(
-                model=self.model,
-                max_tokens=self.max_tokens,
-                messages=[{"role": "user", "content": prompt}],
+            # Stream so long completions don't sit on one blocking read (and
+            # don't trip the SDK's non-streaming timeout guard).
+            with self.client.messages.stream(
+                **_request_params(ctx, criteria, self.model, self.max_tokens),
+            ) as stream:
+                text = "".join(stream.text_stream)
+                response = stream.get_final_message()
+            return CodeReviewResponse(
+                success=True,
+                review_text=text,
+                scores=parse_scores(text, criteria),
+                input_tokens=response.usage.input_tokens,
+                output_tokens=response.usage.output_tokens,
             )
-            text = response.content[0].text
+        except Exception as e:
+            return CodeReviewResponse(success=False, error=error_text(e))
+
+    async def areview_code(self, ctx: CodeReviewContext) -> CodeReviewResponse:
+        criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
+        try:
+            async with self._async_client().messages.stream(
+                **_request_params(ctx, criteria, self.model, self.max_tokens),
+            ) as stream:
+                text = "".join([chunk async for chunk in stream.text_stream])
+                response = await stream.get_final_message()
             return CodeReviewResponse(
                 success=True,
                 review_text=text,
@@ -40,4 +153,88 @@ class AnthropicProvider(LLMProvider):
                 output_tokens=response.usage.output_tokens,
             )
         except Exception as e:
-            return CodeReviewResponse(success=False, error=str(e)[:300])
+            return CodeReviewResponse(success=False, error=error_text(e))
+
+    def review_code_batch(self, contexts: list[CodeReviewContext]) -> list[CodeReviewResponse]:
+        """Submit every review as a single Message Batches job and wait for it.
+
+        One HTTP submission + polling replaces N round-trips, and batch
+        requests are billed at a discount.
+        """
+        if not contexts:
+            return []
+        try:
+            return self.collect_batch(self.submit_batch(contexts), contexts)
+        except Exception as e:
+            error = error_text(e)
+            return [CodeReviewResponse(success=False, error=error) for _ in contexts]
+
+    def submit_batch(
+        self, contexts: list[CodeReviewContext], request_ids: list[str] | None = None,
+    ) -> str:
+        requests = []
+        for ctx, custom_id in zip(contexts, _custom_ids(contexts, request_ids)):
+            criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
+            requests.append({
+                "custom_id": custom_id,
+                "params": _request_params(ctx, criteria, self.model, self.max_tokens),
+            })
+        return self.client.messages.batches.create(requests=requests).id
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        contexts: list[CodeReviewContext],
+        request_ids: list[str] | None = None,
+    ) -> list[CodeReviewResponse]:
+        """Poll `batch_id` until it ends, then map results back by `custom_id`.
+
+        404s (expired or deleted batches) and 401/403s (the batch belongs to
+        another key or workspace) raise `BatchGone`; other API errors
+        propagate so callers can keep the batch id and retry.
+        """
+        try:
+            return self._collect_batch(batch_id, contexts, _custom_ids(contexts, request_ids))
+        except Exception as e:
+            if getattr(e, "status_code", None) in BATCH_GONE_STATUS:
+                raise BatchGone(error_text(e)) from e
+            raise
+
+    def _collect_batch(
+        self, batch_id: str, contexts: list[CodeReviewContext], custom_ids: list[str],
+    ) -> list[CodeReviewResponse]:
+        criteria_by_id = {
+            custom_id: ctx.scoring_criteria or DEFAULT_CRITERIA
+            for ctx, custom_id in zip(contexts, custom_ids)
+        }
+        delay = BATCH_POLL_MIN_INTERVAL
+        batch = self.client.messages.batches.retrieve(batch_id)
+        while batch.processing_status != "ended":
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_INTERVAL)
+            batch = self.client.messages.batches.retrieve(batch_id)
+
+        responses: dict[str, CodeReviewResponse] = {}
+        for entry in self.client.messages.batches.results(batch_id):
+            if entry.custom_id not in criteria_by_id:
+                continue
+            if entry.result.type != "succeeded":
+                responses[entry.custom_id] = CodeReviewResponse(
+                    success=False, error=f"batch_request_{entry.result.type}",
+                )
+                continue
+            message = entry.result.message
+            text = message.content[0].text
+            responses[entry.custom_id] = CodeReviewResponse(
+                success=True,
+                review_text=text,
+                scores=parse_scores(text, criteria_by_id[entry.custom_id]),
+                input_tokens=message.usage.input_tokens,
+                output_tokens=message.usage.output_tokens,
+            )
+
+        return [
+            responses.get(custom_id)
+            or CodeReviewResponse(success=False, error="missing_batch_result")
+            for custom_id in custom_ids
+        ]
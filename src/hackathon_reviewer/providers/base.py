@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 
 
+def error_text(exc: BaseException) -> str:
+    """Short error string for a failed provider call.
+
+    Timeouts are reported as plain "timeout" so they are easy to spot in the
+    results and get picked up by the next `--resume` run.
+    """
+    if isinstance(exc, TimeoutError) or "Timeout" in type(exc).__name__:
+        return "timeout"
+    return str(exc)[:300]
+
+
 @dataclass
 class ScoringCriterionDef:
     """A single scoring criterion passed to the LLM."""
@@ -43,6 +55,7 @@ class CodeReviewContext:
     scoring_criteria: list[ScoringCriterionDef] = field(default_factory=list)
     prompt_preamble: str = ""
     review_sections: list[ReviewSectionDef] = field(default_factory=list)
+    truncated: bool = False  # source files / transcript cut to fit the prompt budget
 
 
 @dataclass
@@ -85,6 +98,14 @@ class VideoReviewResponse:
     scores: dict[str, float] = field(default_factory=dict)
 
 
+class BatchGone(Exception):
+    """A batch id can't be collected any more (not found, expired, no access).
+
+    Unlike a network error while polling, waiting won't help; the caller
+    should forget the id and submit a new batch.
+    """
+
+
 class LLMProvider(ABC):
     """Abstract interface for LLM providers."""
 
@@ -92,5 +113,57 @@ class LLMProvider(ABC):
     def review_code(self, context: CodeReviewContext) -> CodeReviewResponse:
         ...
 
+    def code_review_request(self, context: CodeReviewContext) -> dict:
+        """What `review_code` would send for `context`, as JSON-able data.
+
+        Callers hash this to key cached responses, so it has to change
+        whenever the request does: providers that render a prompt return the
+        rendered text plus model settings. The default is the raw context.
+        """
+        return {"provider": self.__class__.__name__, "context": asdict(context)}
+
+    async def areview_code(self, context: CodeReviewContext) -> CodeReviewResponse:
+        """Async variant of `review_code` for event-loop fan-out.
+
+        Providers with a native async client override this; the default
+        runs the sync call in a worker thread.
+        """
+        return await asyncio.to_thread(self.review_code, context)
+
+    def review_code_batch(self, contexts: list[CodeReviewContext]) -> list[CodeReviewResponse]:
+        """Review many projects in one go. Responses are returned in input order.
+
+        Providers with a native batch endpoint override this; the default
+        just reviews each context in turn.
+        """
+        return [self.review_code(ctx) for ctx in contexts]
+
+    def submit_batch(
+        self, contexts: list[CodeReviewContext], request_ids: list[str] | None = None,
+    ) -> str | None:
+        """Start a provider-side batch job and return its id without waiting.
+
+        Lets callers persist the id and re-attach with `collect_batch` after
+        a crash instead of paying for the batch twice. `request_ids` tag each
+        request (default: by team number) and must be passed again to
+        `collect_batch`. Returns None when the provider has no batch endpoint.
+        """
+        return None
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        contexts: list[CodeReviewContext],
+        request_ids: list[str] | None = None,
+    ) -> list[CodeReviewResponse]:
+        """Wait for `batch_id` and return responses in `contexts` order.
+
+        Raises `BatchGone` when the id is no longer usable; other errors
+        while polling propagate as they are. Providers without a batch
+        endpoint (`submit_batch` returns None) never issue an id, so the
+        default fails every entry.
+        """
+        return [CodeReviewResponse(success=False, error="batch_not_supported") for _ in contexts]
+
     def review_video(self, context: VideoReviewContext) -> VideoReviewResponse:
         raise NotImplementedError(f"{self.__class__.__name__} does not support video review")
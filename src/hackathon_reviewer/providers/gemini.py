@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+import threading
 import time
+from functools import lru_cache
 from pathlib import Path
 
 from hackathon_reviewer.providers.base import (
+    BatchGone,
     CodeReviewContext,
     CodeReviewResponse,
     LLMProvider,
@@ -14,20 +19,42 @@ from hackathon_reviewer.providers.base import (
     VideoReviewContext,
     VideoReviewResponse,
     VideoScoreCriterionDef,
+    error_text,
 )
 from hackathon_reviewer.providers.prompts import DEFAULT_CRITERIA
+from hackathon_reviewer.utils.json_io import write_atomic
+
+# Batch polling backs off from the min to the max interval (seconds).
+BATCH_POLL_MIN_INTERVAL = 5
+BATCH_POLL_INTERVAL = 60
+# HTTP statuses meaning a saved batch id will never be collectable.
+BATCH_GONE_STATUS = {401, 403, 404}
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
 
 
 def _build_code_review_prompt(criteria: list[ScoringCriterionDef]) -> str:
+    return _code_review_template(tuple((c.key, c.weight, c.description) for c in criteria))
+
+
+@lru_cache(maxsize=8)
+def _code_review_template(criteria: tuple[tuple[str, float, str], ...]) -> str:
+    """Render the criteria-dependent prompt template once per criteria set."""
     criteria_block = ""
-    for c in criteria:
-        label = c.key.replace("_", " ").title()
-        pct = int(c.weight * 100)
-        criteria_block += f"**{label} ({pct}%):** {c.description}\n"
+    for key, weight, description in criteria:
+        label = key.replace("_", " ").title()
+        pct = int(weight * 100)
+        criteria_block += f"**{label} ({pct}%):** {description}\n"
         criteria_block += "- 1-3: Poor / 4-6: Average / 7-8: Strong / 9-10: Exceptional\n\n"
 
-    json_keys = ", ".join(f'"{c.key}": N' for c in criteria)
-    json_schema = "{" + f"{json_keys}, \"rationale\": \"1-2 sentence summary\"" + "}"
+    json_keys = ", ".join(f'"{key}": N' for key, _, _ in criteria)
+    # Doubled braces: the template still goes through str.format().
+    json_schema = "{{" + f"{json_keys}, \"rationale\": \"1-2 sentence summary\"" + "}}"
+    criteria_block = criteria_block.replace("{", "{{").replace("}", "}}")
 
     return f"""You are a hackathon judge. Score this submission on the following criteria, each 1-10. Be discriminating — use the full range.
 
@@ -94,28 +121,191 @@ Respond with ONLY valid JSON:
 """
 
 
+def _render_code_review_prompt(ctx: CodeReviewContext, criteria: list[ScoringCriterionDef]) -> str:
+    return _build_code_review_prompt(criteria).format(
+        project_name=ctx.project_name,
+        team_name=ctx.team_name,
+        description=ctx.description[:500],
+        loc=ctx.loc,
+        commits=ctx.commits,
+        language=ctx.primary_language,
+        has_tests=ctx.has_tests,
+        patterns=ctx.integration_patterns,
+        source_files=ctx.source_files,
+        transcript=ctx.transcript or "(no transcript available)",
+    )
+
+
+def _parse_code_review(text: str, criteria: list[ScoringCriterionDef]) -> CodeReviewResponse:
+    scores_raw = json.loads(text)
+    scores = {}
+    valid_keys = {c.key for c in criteria}
+    for key, val in scores_raw.items():
+        if key in valid_keys:
+            scores[key] = max(1, min(10, int(val)))
+
+    return CodeReviewResponse(
+        success=True,
+        review_text=scores_raw.get("rationale", ""),
+        scores=scores,
+    )
+
+
+# Sized for the video/code-review worker pools plus batch polling; the
+# httpx default (10 keep-alive) forces re-handshakes under concurrency.
+HTTP_POOL_LIMITS = {"max_connections": 100, "max_keepalive_connections": 100}
+
+
+def _new_client(api_key: str, timeout_s: float | None = None):
+    import httpx
+    from google import genai
+    from google.genai import types
+
+    limits = httpx.Limits(**HTTP_POOL_LIMITS)
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(
+            client_args={"limits": limits},
+            async_client_args={"limits": limits},
+            # HttpOptions takes milliseconds.
+            timeout=int(timeout_s * 1000) if timeout_s is not None else None,
+        ),
+    )
+
+
+@lru_cache(maxsize=4)
+def _client(api_key: str, timeout_s: float | None = None):
+    """One genai client (and so one pooled httpx client) per API key.
+
+    Video analysis, code review and retries all build providers; sharing
+    the client keeps connections warm across them. genai.Client is safe to
+    share between worker threads.
+    """
+    return _new_client(api_key, timeout_s)
+
+
+# The File API keeps uploads for 48h; stop trusting a recorded one well before.
+UPLOAD_REUSE_MAX_AGE_S = 24 * 3600
+
+
+def _file_digest(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "blake2b").hexdigest()[:32]
+
+
+class _UploadRegistry:
+    """Content hash -> File API upload, persisted across runs.
+
+    A video whose analysis call failed after its upload finished is retried
+    later (same run or a resumed one) with the exact same prepared file. The
+    registry lets that retry point Gemini at the existing upload instead of
+    sending hundreds of MB again. Entries are dropped once the analysis
+    succeeds and the upload is deleted.
+
+    Teams that submitted the same video share a digest, and so an upload.
+    Each analysis holds its digest from `acquire` to `release`, and only
+    the last holder to finish deletes the shared upload, so one team's
+    success never pulls the file out from under another's call.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._users: dict[str, int] = {}
+        try:
+            self._entries: dict[str, dict] = json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def acquire(self, digest: str) -> str | None:
+        """Hold `digest` for one analysis; the registered upload to reuse, if any."""
+        with self._lock:
+            self._users[digest] = self._users.get(digest, 0) + 1
+            entry = self._entries.get(digest)
+        if entry and time.time() - entry.get("uploaded_at", 0) < UPLOAD_REUSE_MAX_AGE_S:
+            return entry.get("name")
+        return None
+
+    def release(self, digest: str, name: str | None, success: bool) -> bool:
+        """Let go of `digest`; True when the caller should delete upload `name`.
+
+        The registered upload is deleted (and its entry dropped) only on the
+        last holder's success; a failure keeps it for the retry. An upload
+        that isn't the registered one (two teams uploaded at once) is the
+        caller's alone and goes as soon as its analysis succeeds.
+        """
+        with self._lock:
+            users = self._users.get(digest, 1) - 1
+            if users:
+                self._users[digest] = users
+            else:
+                self._users.pop(digest, None)
+            entry = self._entries.get(digest)
+            if name is None or entry is None or entry.get("name") != name:
+                return success and name is not None
+            if not success or users:
+                return False
+            del self._entries[digest]
+            self._save()
+            return True
+
+    def put(self, digest: str, name: str) -> None:
+        with self._lock:
+            self._entries[digest] = {"name": name, "uploaded_at": time.time()}
+            self._save()
+
+    def drop(self, digest: str) -> None:
+        with self._lock:
+            if self._entries.pop(digest, None) is not None:
+                self._save()
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self.path, json.dumps(self._entries, indent=2).encode())
+        except OSError:
+            pass
+
+
 class GeminiProvider(LLMProvider):
-    def __init__(self, api_key: str, model: str = "gemini-3.1-pro-preview"):
-        from google import genai
-        self.client = genai.Client(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gemini-3.1-pro-preview",
+        timeout_s: float | None = None,
+        upload_registry_path: Path | None = None,
+    ):
+        self.client = _client(api_key, timeout_s)
+        self._uploads = _UploadRegistry(upload_registry_path) if upload_registry_path else None
+        self.api_key = api_key
         self.model = model
+        self.timeout_s = timeout_s
+        self._aclient = None
+        self._aclient_loop = None
+
+    def _async_client(self):
+        """`client.aio` bound to the running loop.
+
+        httpx async pools can't outlive the loop that created them, so a new
+        client is made whenever the stage starts a fresh `asyncio.run`.
+        """
+        loop = asyncio.get_running_loop()
+        if self._aclient is None or self._aclient_loop is not loop:
+            self._aclient = _new_client(self.api_key, self.timeout_s).aio
+            self._aclient_loop = loop
+        return self._aclient
+
+    def code_review_request(self, ctx: CodeReviewContext) -> dict:
+        criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
+        return {
+            "model": self.model,
+            "contents": _render_code_review_prompt(ctx, criteria),
+            "config": {"response_mime_type": "application/json"},
+        }
 
     def review_code(self, ctx: CodeReviewContext) -> CodeReviewResponse:
         criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
-        prompt_template = _build_code_review_prompt(criteria)
-
-        prompt = prompt_template.format(
-            project_name=ctx.project_name,
-            team_name=ctx.team_name,
-            description=ctx.description[:500],
-            loc=ctx.loc,
-            commits=ctx.commits,
-            language=ctx.primary_language,
-            has_tests=ctx.has_tests,
-            patterns=ctx.integration_patterns,
-            source_files=ctx.source_files,
-            transcript=ctx.transcript or "(no transcript available)",
-        )
+        prompt = _render_code_review_prompt(ctx, criteria)
 
         try:
             response = self.client.models.generate_content(
@@ -123,20 +313,101 @@ class GeminiProvider(LLMProvider):
                 contents=prompt,
                 config={"response_mime_type": "application/json"},
             )
-            scores_raw = json.loads(response.text)
-            scores = {}
-            valid_keys = {c.key for c in criteria}
-            for key, val in scores_raw.items():
-                if key in valid_keys:
-                    scores[key] = max(1, min(10, int(val)))
+            return _parse_code_review(response.text, criteria)
+        except Exception as e:
+            return CodeReviewResponse(success=False, error=error_text(e))
 
-            return CodeReviewResponse(
-                success=True,
-                review_text=scores_raw.get("rationale", ""),
-                scores=scores,
+    async def areview_code(self, ctx: CodeReviewContext) -> CodeReviewResponse:
+        criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
+        prompt = _render_code_review_prompt(ctx, criteria)
+
+        try:
+            response = await self._async_client().models.generate_content(
+                model=self.model,
+                contents=prompt,
+                config={"response_mime_type": "application/json"},
             )
+            return _parse_code_review(response.text, criteria)
+        except Exception as e:
+            return CodeReviewResponse(success=False, error=error_text(e))
+
+    def review_code_batch(self, contexts: list[CodeReviewContext]) -> list[CodeReviewResponse]:
+        """Submit every review as one Gemini batch job and wait for it.
+
+        Inline responses come back in request order. If the job can't be
+        submitted or polled, every entry fails, and the caller's resume path
+        retries them.
+        """
+        if not contexts:
+            return []
+        try:
+            return self.collect_batch(self.submit_batch(contexts), contexts)
+        except Exception as e:
+            error = error_text(e)
+            return [CodeReviewResponse(success=False, error=error) for _ in contexts]
+
+    def submit_batch(
+        self, contexts: list[CodeReviewContext], request_ids: list[str] | None = None,
+    ) -> str:
+        # Inline responses come back in request order, so ids aren't needed.
+        requests = [
+            {
+                "contents": [{"role": "user", "parts": [{"text": _render_code_review_prompt(
+                    ctx, ctx.scoring_criteria or DEFAULT_CRITERIA,
+                )}]}],
+                "config": {"response_mime_type": "application/json"},
+            }
+            for ctx in contexts
+        ]
+        return self.client.batches.create(model=self.model, src=requests).name
+
+    def collect_batch(
+        self,
+        batch_id: str,
+        contexts: list[CodeReviewContext],
+        request_ids: list[str] | None = None,
+    ) -> list[CodeReviewResponse]:
+        """Poll the job until it finishes.
+
+        A job that is not found or not visible to this key raises
+        `BatchGone`; other API errors while polling propagate. A job that
+        ends failed, cancelled or expired fails every entry; only entries
+        that errored inside a successful job are retried through
+        `review_code`.
+        """
+        delay = BATCH_POLL_MIN_INTERVAL
+        job = self._get_batch(batch_id)
+        while job.state.name not in BATCH_DONE_STATES:
+            time.sleep(delay)
+            delay = min(delay * 2, BATCH_POLL_INTERVAL)
+            job = self._get_batch(batch_id)
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            error = f"batch_{job.state.name.removeprefix('JOB_STATE_').lower()}"
+            return [CodeReviewResponse(success=False, error=error) for _ in contexts]
+        inlined = (job.dest.inlined_responses if job.dest else None) or []
+
+        results: list[CodeReviewResponse] = []
+        for i, ctx in enumerate(contexts):
+            entry = inlined[i] if i < len(inlined) else None
+            if entry is None:
+                results.append(CodeReviewResponse(success=False, error="missing_batch_result"))
+                continue
+            resp = None
+            if entry.response is not None and not entry.error:
+                try:
+                    resp = _parse_code_review(entry.response.text, ctx.scoring_criteria or DEFAULT_CRITERIA)
+                except Exception:
+                    resp = None
+            results.append(resp or self.review_code(ctx))
+        return results
+
+    def _get_batch(self, batch_id: str):
+        try:
+            return self.client.batches.get(name=batch_id)
         except Exception as e:
-            return CodeReviewResponse(success=False, error=str(e)[:300])
+            if getattr(e, "code", None) in BATCH_GONE_STATUS:
+                raise BatchGone(error_text(e)) from e
+            raise
 
     def review_video(self, ctx: VideoReviewContext) -> VideoReviewResponse:
         if not ctx.video_path or not ctx.video_path.exists():
@@ -145,16 +416,29 @@ class GeminiProvider(LLMProvider):
         prompt = _build_video_prompt(ctx)
 
         try:
-            video_file = self.client.files.upload(
-                file=ctx.video_path,
-                config={"mime_type": "video/mp4"},
-            )
+            digest = _file_digest(ctx.video_path) if self._uploads else None
+        except OSError as e:
+            return VideoReviewResponse(success=False, error=str(e)[:300])
+
+        video_file = None
+        success = False
+        try:
+            video_file = self._reusable_upload(digest) if digest else None
+            if video_file is None:
+                video_file = self.client.files.upload(
+                    file=ctx.video_path,
+                    config={"mime_type": "video/mp4"},
+                )
+                if digest:
+                    self._uploads.put(digest, video_file.name)
 
             while video_file.state.name == "PROCESSING":
                 time.sleep(2)
                 video_file = self.client.files.get(name=video_file.name)
 
             if video_file.state.name == "FAILED":
+                if digest:
+                    self._uploads.drop(digest)
                 return VideoReviewResponse(
                     success=False,
                     error=f"Video processing failed: {video_file.state.name}",
@@ -167,11 +451,7 @@ class GeminiProvider(LLMProvider):
             )
 
             result = json.loads(response.text)
-
-            try:
-                self.client.files.delete(name=video_file.name)
-            except Exception:
-                pass
+            success = True
 
             scores = {}
             if "scores" in result and isinstance(result["scores"], dict):
@@ -189,3 +469,32 @@ class GeminiProvider(LLMProvider):
 
         except Exception as e:
             return VideoReviewResponse(success=False, error=str(e)[:300])
+        finally:
+            self._finish_upload(digest, video_file, success)
+
+    def _finish_upload(self, digest: str | None, video_file, success: bool) -> None:
+        """Delete the upload once no analysis needs it any more."""
+        name = video_file.name if video_file is not None else None
+        if digest:
+            delete = self._uploads.release(digest, name, success)
+        else:
+            delete = success and name is not None
+        if delete:
+            try:
+                self.client.files.delete(name=name)
+            except Exception:
+                pass
+
+    def _reusable_upload(self, digest: str):
+        """Hold `digest` and return its registered upload, if Gemini still has it."""
+        name = self._uploads.acquire(digest)
+        if name is None:
+            return None
+        try:
+            video_file = self.client.files.get(name=name)
+        except Exception:
+            video_file = None
+        if video_file is None or video_file.state.name not in ("ACTIVE", "PROCESSING"):
+            self._uploads.drop(digest)
+            return None
+        return video_file
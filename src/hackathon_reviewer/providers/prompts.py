@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+
 from hackathon_reviewer.providers.base import (
     CodeReviewContext,
     ReviewSectionDef,
@@ -39,22 +42,37 @@ DEFAULT_CRITERIA = [
 ]
 
 
-def build_sections_block(sections: list[ReviewSectionDef]) -> str:
-    lines = []
-    for s in sections:
-        lines.append(f"**{s.name}:** [{s.instruction}]")
-    return "\n\n".join(lines)
+# The sections / scores blocks only depend on config, which is identical for
+# every submission in a run — render them once per distinct config.
 
+@lru_cache(maxsize=8)
+def _sections_block(sections: tuple[tuple[str, str], ...]) -> str:
+    return "\n\n".join(f"**{name}:** [{instruction}]" for name, instruction in sections)
 
-def build_scores_section(criteria: list[ScoringCriterionDef]) -> str:
+
+@lru_cache(maxsize=8)
+def _scores_section(criteria: tuple[tuple[str, str], ...]) -> str:
     lines = ["**Scores:**"]
-    for c in criteria:
-        label = c.key.replace("_", " ").title()
-        lines.append(f"- {label}: [1-10] — [one sentence justification] ({c.description})")
+    for key, description in criteria:
+        label = key.replace("_", " ").title()
+        lines.append(f"- {label}: [1-10] — [one sentence justification] ({description})")
     return "\n".join(lines)
 
 
-def build_code_review_prompt(ctx: CodeReviewContext, criteria: list[ScoringCriterionDef]) -> str:
+def build_sections_block(sections: list[ReviewSectionDef]) -> str:
+    return _sections_block(tuple((s.name, s.instruction) for s in sections))
+
+
+def build_scores_section(criteria: list[ScoringCriterionDef]) -> str:
+    return _scores_section(tuple((c.key, c.description) for c in criteria))
+
+
+def build_code_review_instructions(ctx: CodeReviewContext, criteria: list[ScoringCriterionDef]) -> str:
+    """The static half of the prompt: role, format and calibration.
+
+    Identical for every submission in a run, so providers that support
+    prompt caching can send it as a cached system block.
+    """
     sections = ctx.review_sections if ctx.review_sections else DEFAULT_REVIEW_SECTIONS
 
     preamble = ctx.prompt_preamble or "Write a detailed narrative review."
@@ -79,8 +97,12 @@ Use the full 1-10 range. Target distribution:
 - 5-6: ~40% (solid effort, average quality — most should land here)
 - 7-8: ~20% (strong, impressive, stands out)
 - 9-10: ~10% (exceptional, wow factor, best-in-class)
+"""
+
 
-## Submission
+def build_code_review_submission(ctx: CodeReviewContext) -> str:
+    """The per-submission half of the prompt."""
+    return f"""## Submission
 
 **Project:** {ctx.project_name}
 **Team:** {ctx.team_name} (Team #{ctx.team_number})
@@ -106,29 +128,36 @@ Use the full 1-10 range. Target distribution:
 """
 
 
-def parse_scores(text: str, criteria: list[ScoringCriterionDef]) -> dict[str, float]:
-    """Extract scores from the review text, matching against configured criteria."""
-    scores: dict[str, float] = {}
+def build_code_review_prompt(ctx: CodeReviewContext, criteria: list[ScoringCriterionDef]) -> str:
+    return build_code_review_instructions(ctx, criteria) + "\n" + build_code_review_submission(ctx)
+
 
+@lru_cache(maxsize=8)
+def _score_matcher(keys: tuple[str, ...]) -> tuple[dict[str, str], re.Pattern[str]]:
+    """Label -> criterion key map plus the compiled `- <label>: <int>` regex.
+
+    Both depend only on the criteria keys, so they're built once per
+    criteria set rather than on every review.
+    """
     label_to_key = {}
-    for c in criteria:
-        label_to_key[c.key.replace("_", " ").lower()] = c.key
-        label_to_key[c.key.lower()] = c.key
-
-    for line in text.split("\n"):
-        line_stripped = line.strip()
-        if not line_stripped.startswith("- "):
-            continue
-        line_lower = line_stripped.lower()
-
-        for label, key in label_to_key.items():
-            if line_lower.startswith(f"- {label}:"):
-                try:
-                    score_part = line_stripped.split(":", 1)[1].strip()
-                    val = int(score_part.split("/")[0].strip().split()[0])
-                    scores[key] = max(1, min(10, val))
-                except (ValueError, IndexError):
-                    pass
-                break
-
-    return scores
+    for key in keys:
+        label_to_key[key.replace("_", " ").lower()] = key
+        label_to_key[key.lower()] = key
+
+    # Longest labels first so a label that prefixes another can't shadow it.
+    labels = sorted(label_to_key, key=len, reverse=True)
+    alternation = "|".join(re.escape(label) for label in labels)
+    regex = re.compile(
+        rf"^[ \t]*- ({alternation}):[ \t]*([+-]?\d+)(?=[\s/]|$)",
+        re.IGNORECASE | re.MULTILINE,
+    )
+    return label_to_key, regex
+
+
+def parse_scores(text: str, criteria: list[ScoringCriterionDef]) -> dict[str, float]:
+    """Extract scores from the review text, matching against configured criteria."""
+    label_to_key, regex = _score_matcher(tuple(c.key for c in criteria))
+    return {
+        label_to_key[label.lower()]: max(1, min(10, int(val)))
+        for label, val in regex.findall(text)
+    }
@@ -5,7 +5,9 @@ from __future__ import annotations
 import json
 import os
 import re
-from datetime import datetime
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
 import click
@@ -21,6 +23,9 @@ from hackathon_reviewer.models import (
     Submission,
 )
 from hackathon_reviewer.utils.git import is_valid_repo, run_git
+from hackathon_reviewer.utils.json_io import dump_model_list, load_model_list
+from hackathon_reviewer.utils.llm_cache import repo_head_sha, stable_hash
+from hackathon_reviewer.utils.process_pool import process_pool
 
 CLONE_TIMEOUT = 240          # per-attempt seconds; large repos can be slow
 MAX_CLONE_RETRIES = 4        # 5 total attempts: handles transient network blips
@@ -43,17 +48,17 @@ def _is_permanent_clone_error(stderr: str) -> bool:
     s = (stderr or "").lower()
     return any(p in s for p in _PERMANENT_CLONE_ERRORS)
 
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules", ".git", "vendor", "venv", ".venv", "__pycache__",
     ".next", "dist", "build", ".cache", "target", "coverage",
     ".idea", ".vscode", "env", ".env",
-}
+})
 
-SKIP_EXTENSIONS = {
+SKIP_EXTENSIONS = frozenset({
     ".lock", ".svg", ".png", ".jpg", ".jpeg", ".gif", ".ico",
     ".woff", ".woff2", ".ttf", ".eot", ".map", ".min.js", ".min.css",
     ".pyc", ".pyo", ".so", ".dylib", ".dll", ".exe",
-}
+})
 
 LANGUAGE_EXTENSIONS = {
     ".py": "Python", ".js": "JavaScript", ".ts": "TypeScript",
@@ -66,7 +71,23 @@ LANGUAGE_EXTENSIONS = {
     ".yaml": "YAML", ".yml": "YAML", ".toml": "TOML",
 }
 
-LOCK_FILES = {"package-lock.json", "yarn.lock", "pnpm-lock.yaml", "Cargo.lock", "poetry.lock"}
+LOCK_FILES = frozenset({"package-lock.json", "yarn.lock", "pnpm-lock.yaml", "Cargo.lock", "poetry.lock"})
+
+# ASCII whitespace other than the newline itself. Deleting these leaves
+# blank lines as empty segments between newlines.
+_INLINE_WHITESPACE = b" \t\r\f\v"
+
+# Bump when _scan_repo_files / _analyze_git_history output changes, so
+# cached per-checkout scans are recomputed.
+SCAN_CACHE_VERSION = 1
+
+# Only the first 512KB of each file is read for LOC; bigger files (usually
+# generated JSON/CSV/bundles) are extrapolated from that prefix by size.
+MAX_LOC_READ_BYTES = 512 * 1024
+
+# A file named like a test/spec script with one of these extensions marks
+# the repo as having tests.
+TEST_FILE_EXTENSIONS = (".py", ".js", ".ts", ".tsx", ".jsx", ".rs", ".go")
 
 
 # ---------------------------------------------------------------------------
@@ -81,16 +102,18 @@ def _clone_repo(
     import shutil
     import time
 
-    dest_dir = dest_dir.resolve()
+    # absolute() rather than resolve(): git runs with cwd=dest_dir.parent, so
+    # the path only has to be absolute, and resolve() stats every component.
+    dest_dir = dest_dir.absolute()
     if dest_dir.exists() and is_valid_repo(dest_dir):
         return True, None
 
     # One-time migration: existing caches were keyed by sanitized_name. If
     # the team has a valid clone at the legacy path, rename it to the new
     # URL-hash path. Saves users from re-cloning ~all of their data.
-    if legacy_dir is not None and legacy_dir != dest_dir:
-        legacy = legacy_dir.resolve()
-        if legacy.exists() and is_valid_repo(legacy):
+    if legacy_dir is not None:
+        legacy = legacy_dir.absolute()
+        if legacy != dest_dir and legacy.exists() and is_valid_repo(legacy):
             dest_dir.parent.mkdir(parents=True, exist_ok=True)
             try:
                 legacy.rename(dest_dir)
@@ -107,8 +130,12 @@ def _clone_repo(
             delay = min(RETRY_DELAY_BASE * (2 ** (attempt - 1)), RETRY_DELAY_MAX)
             time.sleep(delay)
 
+        # Blobless partial clone: all commits and trees (git-history analysis
+        # needs the full log), but only the blobs HEAD checks out. Not
+        # --depth=1 — that would truncate commit counts and hackathon-period
+        # flags. Servers without filter support just do a full clone.
         rc, _, stderr = run_git(
-            ["clone", clone_url, str(dest_dir)],
+            ["clone", "--filter=blob:none", clone_url, str(dest_dir)],
             str(dest_dir.parent),
             timeout=CLONE_TIMEOUT,
         )
@@ -128,6 +155,41 @@ def _clone_repo(
 # Repo file metadata
 # ---------------------------------------------------------------------------
 
+def _count_non_blank_lines(data: bytes) -> int:
+    """Lines with at least one non-whitespace byte, counted in C (translate + split)."""
+    segments = data.translate(None, _INLINE_WHITESPACE).split(b"\n")
+    return len(segments) - segments.count(b"")
+
+
+def _suffix(fname: str) -> str:
+    """`Path(fname).suffix` without building a Path (dotfiles have none)."""
+    i = fname.rfind(".")
+    return fname[i:] if 0 < i < len(fname) - 1 else ""
+
+
+def _iter_repo_files(top: Path | str) -> Iterator[os.DirEntry]:
+    """Files under `top`, skipping SKIP_DIRS, via recursive `os.scandir`.
+
+    DirEntry carries the d_type from readdir, so classifying entries costs
+    no extra stat per file. Like `os.walk`, symlinked directories aren't
+    descended into but symlinked files are still yielded.
+    """
+    try:
+        it = os.scandir(top)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        yield from _iter_repo_files(entry.path)
+                elif entry.is_file():
+                    yield entry
+            except OSError:
+                continue
+
+
 def _scan_repo_files(repo_dir: Path) -> RepoFiles:
     files = RepoFiles()
     if not repo_dir.exists():
@@ -135,25 +197,32 @@ def _scan_repo_files(repo_dir: Path) -> RepoFiles:
 
     lang_loc: dict[str, int] = {}
 
-    for root, dirs, filenames in os.walk(repo_dir):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for fname in filenames:
-            fpath = Path(root) / fname
-            ext = fpath.suffix.lower()
-            if ext in SKIP_EXTENSIONS or fname in LOCK_FILES:
-                continue
+    for entry in _iter_repo_files(repo_dir):
+        fname = entry.name
+        if not files.has_tests:
+            lower = fname.lower()
+            if ("test" in lower or "spec" in lower) and lower.endswith(TEST_FILE_EXTENSIONS):
+                files.has_tests = True
+        ext = _suffix(fname).lower()
+        if ext in SKIP_EXTENSIONS or fname in LOCK_FILES:
+            continue
 
-            files.file_count += 1
+        files.file_count += 1
 
-            try:
-                with open(fpath, "r", encoding="utf-8", errors="ignore") as f:
-                    lines = sum(1 for line in f if line.strip())
-                files.total_loc += lines
-                if ext in LANGUAGE_EXTENSIONS:
-                    lang = LANGUAGE_EXTENSIONS[ext]
-                    lang_loc[lang] = lang_loc.get(lang, 0) + lines
-            except OSError:
-                pass
+        try:
+            with open(entry.path, "rb") as f:
+                head = f.read(MAX_LOC_READ_BYTES)
+            lines = _count_non_blank_lines(head)
+            if len(head) == MAX_LOC_READ_BYTES:
+                size = entry.stat().st_size
+                if size > MAX_LOC_READ_BYTES:
+                    lines = lines * size // MAX_LOC_READ_BYTES
+            files.total_loc += lines
+            lang = LANGUAGE_EXTENSIONS.get(ext)
+            if lang:
+                lang_loc[lang] = lang_loc.get(lang, 0) + lines
+        except OSError:
+            pass
 
     files.languages = dict(sorted(lang_loc.items(), key=lambda x: -x[1]))
     if lang_loc:
@@ -164,18 +233,6 @@ def _scan_repo_files(repo_dir: Path) -> RepoFiles:
         for name in ["README.md", "readme.md", "README.rst", "README", "README.txt"]
     )
 
-    for root, dirs, filenames in os.walk(repo_dir):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for fname in filenames:
-            lower = fname.lower()
-            if ("test" in lower or "spec" in lower) and any(
-                lower.endswith(ext) for ext in [".py", ".js", ".ts", ".tsx", ".jsx", ".rs", ".go"]
-            ):
-                files.has_tests = True
-                break
-        if files.has_tests:
-            break
-
     return files
 
 
@@ -247,19 +304,90 @@ def _identity_key(name: str, email: str) -> str:
     return f"name:{(name or '').strip().lower()}"
 
 
-def _analyze_git_history(repo_dir: Path, cfg: ReviewConfig) -> GitHistory:
-    history = GitHistory()
-    if not repo_dir.exists():
-        return history
+# (hash, author date in the author's local time, author name, author email, message)
+CommitRecord = tuple[str, datetime, str, str, str]
+
 
-    # Use NUL-delimited commits with a record separator so commit messages
-    # (which may contain newlines and pipes) don't break parsing. Trailing
-    # \x1e separates commits, \x1f separates fields within a commit.
+def _read_commits_pygit2(repo_dir: Path) -> list[CommitRecord] | None:
+    """Every commit reachable from any ref, read in-process via libgit2.
+
+    Same view as `git log --all` with .mailmap applied, minus the fork and
+    text round-trip. Returns None when pygit2 isn't installed or can't read
+    the repo, so the caller falls back to the git CLI.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+
+    try:
+        repo = pygit2.Repository(str(repo_dir))
+        mailmap = pygit2.Mailmap.from_repository(repo)
+        refs = list(repo.references.objects)
+        if not repo.head_is_unborn:
+            refs.append(repo.head)
+        tips = set()
+        for ref in refs:
+            try:
+                tips.add(ref.peel(pygit2.Commit).id)
+            except Exception:
+                continue  # ref to a tree/blob, or a broken ref
+        if not tips:
+            return []
+
+        tips = list(tips)
+        walker = repo.walk(tips[0], pygit2.GIT_SORT_TIME)
+        for tip in tips[1:]:
+            walker.push(tip)
+
+        records: list[CommitRecord] = []
+        for commit in walker:
+            author = mailmap.resolve_signature(commit.author)
+            tz = timezone(timedelta(minutes=author.offset))
+            dt = datetime.fromtimestamp(author.time, tz).replace(tzinfo=None)
+            records.append((str(commit.id), dt, author.name, author.email, commit.message))
+        return records
+    except Exception:
+        return None
+
+
+# One `git log` record: hash, author unix time, author UTC offset (+HHMM),
+# name, email, raw body. Fields are \x1f-separated and records end in \x1e
+# so multi-line messages containing pipes can't break parsing.
+_GIT_LOG_FORMAT = "--pretty=format:%H%x1f%at%x1f%ad%x1f%aN%x1f%aE%x1f%B%x1e"
+_GIT_LOG_RECORD_RE = re.compile(
+    r"([0-9a-f]+)\x1f(-?\d+)\x1f([+-])(\d\d)(\d\d)\x1f([^\x1f]*)\x1f([^\x1f]*)\x1f([^\x1e]*)\x1e"
+)
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _read_commits_git(repo_dir: Path) -> list[CommitRecord]:
     rc, stdout, _ = run_git(
-        ["log", "--all", "--pretty=format:%H%x1f%aI%x1f%aN%x1f%aE%x1f%B%x1e"],
+        ["log", "--all", "--date=format:%z", _GIT_LOG_FORMAT],
         str(repo_dir),
     )
     if rc != 0 or not stdout.strip():
+        return []
+
+    # Author wall-clock time: unix seconds shifted by the author's offset,
+    # i.e. what %aI shows with the timezone dropped.
+    records: list[CommitRecord] = []
+    for commit_hash, ts, sign, hh, mm, name, email, body in _GIT_LOG_RECORD_RE.findall(stdout):
+        offset = (int(hh) * 3600 + int(mm) * 60) * (-1 if sign == "-" else 1)
+        dt = _EPOCH + timedelta(seconds=int(ts) + offset)
+        records.append((commit_hash, dt, name, email, body.strip()))
+    return records
+
+
+def _analyze_git_history(repo_dir: Path, cfg: ReviewConfig) -> GitHistory:
+    history = GitHistory()
+    if not repo_dir.exists():
+        return history
+
+    log = _read_commits_pygit2(repo_dir)
+    if log is None:
+        log = _read_commits_git(repo_dir)
+    if not log:
         return history
 
     extra_bots = list(getattr(cfg.hackathon, "extra_bot_authors", []) or []) if cfg.hackathon else []
@@ -269,19 +397,7 @@ def _analyze_git_history(repo_dir: Path, cfg: ReviewConfig) -> GitHistory:
     bot_identities: set[str] = set()
     raw_author_names: set[str] = set()
 
-    for raw in stdout.split("\x1e"):
-        rec = raw.strip()
-        if not rec:
-            continue
-        parts = rec.split("\x1f")
-        if len(parts) < 5:
-            continue
-        commit_hash, date_str, author_name, author_email, body = parts
-        try:
-            dt = datetime.fromisoformat(date_str.replace("Z", "+00:00")).replace(tzinfo=None)
-        except ValueError:
-            continue
-
+    for commit_hash, dt, author_name, author_email, body in log:
         commits.append({"hash": commit_hash, "date": dt, "author": author_name, "message": body})
         raw_author_names.add(author_name)
 
@@ -393,7 +509,8 @@ def _analyze_git_history(repo_dir: Path, cfg: ReviewConfig) -> GitHistory:
 # Process one submission
 # ---------------------------------------------------------------------------
 
-def _process_one(sub: Submission, cfg: ReviewConfig) -> RepoMetadata:
+def _clone_one(sub: Submission, cfg: ReviewConfig) -> tuple[RepoMetadata, Path | None]:
+    """Clone step only. Returns the metadata stub and the repo dir on success."""
     from hackathon_reviewer.utils.cache_key import repo_cache_key
 
     meta = RepoMetadata(
@@ -405,7 +522,7 @@ def _process_one(sub: Submission, cfg: ReviewConfig) -> RepoMetadata:
 
     if not sub.github.is_valid or not sub.github.clone_url:
         meta.clone_error = "no_valid_github_url"
-        return meta
+        return meta, None
 
     repo_dir = cfg.repos_dir / repo_cache_key(sub)
     legacy_dir = cfg.repos_dir / sub.sanitized_name
@@ -414,11 +531,63 @@ def _process_one(sub: Submission, cfg: ReviewConfig) -> RepoMetadata:
     )
     meta.clone_success = success
     meta.clone_error = error
+    return meta, (repo_dir if success else None)
+
 
-    if success:
-        meta.files = _scan_repo_files(repo_dir)
-        meta.git_history = _analyze_git_history(repo_dir, cfg)
+def _scan_signature(head_sha: str | None, cfg: ReviewConfig) -> str | None:
+    """What a cached scan depends on: the checked-out commit and hackathon dates."""
+    if not head_sha:
+        return None
+    hackathon = cfg.hackathon.model_dump(mode="json") if cfg.hackathon else None
+    return stable_hash({"head": head_sha, "hackathon": hackathon, "v": SCAN_CACHE_VERSION})
 
+
+def _scan_cache_path(repo_dir: Path) -> Path:
+    # Beside the checkout rather than in output_dir, so a shared repos dir
+    # (web mode) keeps scans across runs and output dirs.
+    return repo_dir.parent / f"{repo_dir.name}.scan.json"
+
+
+def _repo_metadata(repo_dir: Path, cfg: ReviewConfig) -> tuple[RepoFiles, GitHistory, str | None]:
+    """File scan + git history for a cloned repo, plus its HEAD sha.
+
+    CPU-bound; runs in a worker process. Reuses the previous scan of this
+    checkout when HEAD (and the hackathon window) hasn't changed, so resumed
+    or repeated runs skip the tree walk and `git log` entirely.
+    """
+    head_sha = repo_head_sha(repo_dir)
+    signature = _scan_signature(head_sha, cfg)
+    cache_path = _scan_cache_path(repo_dir)
+
+    if signature and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text(encoding="utf-8"))
+            if cached.get("signature") == signature:
+                return (
+                    RepoFiles.model_validate(cached["files"]),
+                    GitHistory.model_validate(cached["git_history"]),
+                    head_sha,
+                )
+        except (OSError, ValueError, KeyError):
+            pass
+
+    files, history = _scan_repo_files(repo_dir), _analyze_git_history(repo_dir, cfg)
+    if signature:
+        try:
+            cache_path.write_text(json.dumps({
+                "signature": signature,
+                "files": files.model_dump(mode="json"),
+                "git_history": history.model_dump(mode="json"),
+            }), encoding="utf-8")
+        except OSError:
+            pass
+    return files, history, head_sha
+
+
+def _process_one(sub: Submission, cfg: ReviewConfig) -> RepoMetadata:
+    meta, repo_dir = _clone_one(sub, cfg)
+    if repo_dir is not None:
+        meta.files, meta.git_history, meta.head_sha = _repo_metadata(repo_dir, cfg)
     return meta
 
 
@@ -434,6 +603,8 @@ def run_clone(
 ) -> list[RepoMetadata]:
     """Clone all repos, extract metadata, save to JSON."""
     click.echo("\n--- Stage 2: Clone Repositories ---")
+    workers = cfg.concurrency.clone_workers
+    click.echo(f"  Workers: {workers}")
 
     existing: dict[int, RepoMetadata] = {}
     out_path = cfg.data_dir / "repo_metadata.json"
@@ -441,32 +612,53 @@ def run_clone(
         existing = {m.team_number: m for m in _load_metadata_file(out_path)}
         click.echo(f"  Resuming: {len(existing)} already processed")
 
-    total = len(submissions)
-    results: list[RepoMetadata] = []
-    for i, sub in enumerate(tqdm(submissions, desc="Cloning repos"), 1):
+    by_team: dict[int, RepoMetadata] = {}
+    work: list[Submission] = []
+    for sub in submissions:
         if resume and sub.team_number in existing and existing[sub.team_number].clone_success:
-            results.append(existing[sub.team_number])
+            by_team[sub.team_number] = existing[sub.team_number]
         else:
-            meta = _process_one(sub, cfg)
-            results.append(meta)
+            work.append(sub)
+
+    total = len(submissions)
+    done = total - len(work)
+
+    # Clones are network-bound and each writes its own dest dir, so they
+    # overlap safely on threads; git runs as a subprocess outside the GIL.
+    # The file scan + history parse that follows is CPU-bound Python, so it
+    # goes to a process pool and runs alongside the remaining clones.
+    scans = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool, process_pool() as cpu_pool:
+        futures = {pool.submit(_clone_one, sub, cfg): sub for sub in work}
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Cloning repos"):
+            sub = futures[future]
+            meta, repo_dir = future.result()
+            by_team[sub.team_number] = meta
+            if repo_dir is not None:
+                scans[cpu_pool.submit(_repo_metadata, repo_dir, cfg)] = meta
+            done += 1
             if not meta.clone_success and progress:
                 progress.add_failure(sub.team_number, sub.team_name, sub.project_name, meta.clone_error or "unknown")
-        if progress:
-            progress.update(i, total, sub.project_name)
+            if progress:
+                progress.update(done, total, sub.project_name)
+
+        for future in as_completed(scans):
+            meta = scans[future]
+            meta.files, meta.git_history, meta.head_sha = future.result()
+
+    results = [by_team[sub.team_number] for sub in submissions]
 
     cloned = sum(1 for r in results if r.clone_success)
     click.echo(f"  Cloned: {cloned}/{len(results)}")
 
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump([r.model_dump(mode="json") for r in results], f, indent=2, ensure_ascii=False)
+    dump_model_list(out_path, results, RepoMetadata)
     click.echo(f"  Saved to {out_path}")
 
     return results
 
 
 def _load_metadata_file(path: Path) -> list[RepoMetadata]:
-    with open(path) as f:
-        return [RepoMetadata(**r) for r in json.load(f)]
+    return load_model_list(path, RepoMetadata)
 
 
 def load_repo_metadata(cfg: ReviewConfig) -> list[RepoMetadata]:
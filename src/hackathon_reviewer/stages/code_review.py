@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Callable
+from dataclasses import asdict, replace
 from pathlib import Path
 
 import click
@@ -19,17 +20,44 @@ from hackathon_reviewer.models import (
     StaticAnalysisResult,
     Submission,
 )
-from hackathon_reviewer.providers.base import CodeReviewContext, LLMProvider, ReviewSectionDef, ScoringCriterionDef
+from hackathon_reviewer.providers.base import (
+    BatchGone,
+    CodeReviewContext,
+    CodeReviewResponse,
+    LLMProvider,
+    ReviewSectionDef,
+    ScoringCriterionDef,
+    error_text,
+)
+from hackathon_reviewer.providers.prompts import DEFAULT_CRITERIA, build_code_review_prompt
 from hackathon_reviewer.utils.file_reader import read_key_files
+from hackathon_reviewer.utils.checkpoint import ListCheckpoint
+from hackathon_reviewer.utils.json_io import dump_model_list, load_model_list, write_atomic
+from hackathon_reviewer.utils.llm_cache import PromptCache, stable_hash
+from hackathon_reviewer.utils.rate_limit import LLMRateLimiter
+
+
+TRANSCRIPT_PROMPT_CHARS = 2000
 
 
 def _get_transcript(cfg: ReviewConfig, sanitized_name: str) -> str:
-    """Read video transcript if available."""
+    """Read video transcript if available.
+
+    Only the first TRANSCRIPT_PROMPT_CHARS reach the prompt, so read just
+    enough of the file to fill them rather than the whole transcript.
+    """
     tp = cfg.videos_dir / f"{sanitized_name}_transcript.txt"
-    if tp.exists():
-        text = tp.read_text(encoding="utf-8").strip()
-        return text[:2000] + "... (truncated)" if len(text) > 2000 else text
-    return "(no transcript available)"
+    limit = TRANSCRIPT_PROMPT_CHARS
+    try:
+        with open(tp, encoding="utf-8") as f:
+            text = ""
+            while chunk := f.read(limit + 1):
+                text = (text + chunk).lstrip()
+                if len(text.rstrip()) > limit:
+                    return text[:limit] + "... (truncated)"
+    except FileNotFoundError:
+        return "(no transcript available)"
+    return text.strip()
 
 
 def _build_provider(cfg: ReviewConfig) -> LLMProvider:
@@ -44,6 +72,8 @@ def _build_provider(cfg: ReviewConfig) -> LLMProvider:
             api_key=cfg.anthropic_api_key,
             model=cfg.code_review.model,
             max_tokens=cfg.code_review.max_tokens,
+            timeout_s=cfg.code_review.request_timeout_s,
+            max_retries=cfg.code_review.max_retries,
         )
     elif provider_name == "gemini":
         from hackathon_reviewer.providers.gemini import GeminiProvider
@@ -52,27 +82,54 @@ def _build_provider(cfg: ReviewConfig) -> LLMProvider:
         return GeminiProvider(
             api_key=cfg.gemini_api_key,
             model=cfg.code_review.model,
+            timeout_s=cfg.code_review.request_timeout_s,
         )
     else:
         raise ValueError(f"Unknown code review provider: {provider_name}")
 
 
-def _review_one(
-    provider: LLMProvider,
+# Rough chars-per-token for English prose and code. Good enough to bound
+# cost without a count_tokens round-trip per submission.
+CHARS_PER_TOKEN = 4
+_BUDGET_TRUNCATION_MARKER = "\n... (truncated to fit prompt budget)"
+
+# Upper bound on in-flight review requests, whatever the config says —
+# beyond this providers start returning rate-limit errors.
+MAX_LLM_CONCURRENCY = 32
+
+
+def _fit_token_budget(ctx: CodeReviewContext, max_prompt_tokens: int) -> None:
+    """Trim source files, then the transcript, until the prompt fits the budget.
+
+    Sets `ctx.truncated` when anything was cut, so the result can say so.
+    """
+    criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
+    excess = len(build_code_review_prompt(ctx, criteria)) - max_prompt_tokens * CHARS_PER_TOKEN
+    for field in ("source_files", "transcript"):
+        if excess <= 0:
+            return
+        text = getattr(ctx, field)
+        # Replacing a field no longer than the marker wouldn't save anything.
+        if len(text) <= len(_BUDGET_TRUNCATION_MARKER):
+            continue
+        cut = min(len(text), excess + len(_BUDGET_TRUNCATION_MARKER))
+        setattr(ctx, field, text[:len(text) - cut] + _BUDGET_TRUNCATION_MARKER)
+        excess -= cut - len(_BUDGET_TRUNCATION_MARKER)
+        ctx.truncated = True
+
+
+def _estimate_prompt_tokens(ctx: CodeReviewContext) -> int:
+    criteria = ctx.scoring_criteria if ctx.scoring_criteria else DEFAULT_CRITERIA
+    return len(build_code_review_prompt(ctx, criteria)) // CHARS_PER_TOKEN
+
+
+def _build_context(
     sub: Submission,
     meta: RepoMetadata,
     static: StaticAnalysisResult,
     cfg: ReviewConfig,
-) -> CodeReviewResult:
-    result = CodeReviewResult(
-        team_number=sub.team_number,
-        model_used=cfg.code_review.model,
-    )
-
-    if not meta.clone_success:
-        result.error = "repo_not_cloned"
-        return result
-
+) -> CodeReviewContext:
+    """Assemble the LLM context for one team (reads key source files)."""
     from hackathon_reviewer.utils.cache_key import resolve_repo_dir
     repo_dir = resolve_repo_dir(cfg.repos_dir, sub)
     source_files = read_key_files(repo_dir, max_chars=cfg.code_review.max_source_chars)
@@ -115,52 +172,263 @@ def _review_one(
         prompt_preamble=cfg.code_review.prompt_preamble,
         review_sections=section_defs,
     )
+    _fit_token_budget(ctx, cfg.code_review.max_prompt_tokens)
+    return ctx
 
-    resp = provider.review_code(ctx)
-
-    result.success = resp.success
-    result.error = resp.error
-    result.review_text = resp.review_text
-    result.input_tokens = resp.input_tokens
-    result.output_tokens = resp.output_tokens
 
+def _to_result(
+    sub: Submission, resp: CodeReviewResponse, cfg: ReviewConfig, ctx: CodeReviewContext,
+) -> CodeReviewResult:
+    result = CodeReviewResult(
+        team_number=sub.team_number,
+        model_used=cfg.code_review.model,
+        success=resp.success,
+        error=resp.error,
+        review_text=resp.review_text,
+        input_tokens=resp.input_tokens,
+        output_tokens=resp.output_tokens,
+        truncated=ctx.truncated,
+    )
     for key, val in resp.scores.items():
         result.scores[key] = CriterionScore(score=val, source=cfg.code_review.provider)
-
     return result
 
 
-# ---------------------------------------------------------------------------
-# Stage entry points
-# ---------------------------------------------------------------------------
+def _prompt_cache(cfg: ReviewConfig) -> PromptCache:
+    return PromptCache(cfg.prompt_cache_dir, "code_review")
 
-_save_lock = threading.Lock()
 
+def _prompt_key(provider: LLMProvider, ctx: CodeReviewContext, cfg: ReviewConfig) -> str:
+    """Content address of a review request: the exact payload sent.
 
-def _code_review_config_sig(cfg: ReviewConfig) -> str:
-    from hackathon_reviewer.utils.llm_cache import stable_hash
+    Hashing the rendered request rather than the context means a prompt
+    template edit invalidates old entries by itself. The prompt names the
+    team, so a review is never handed to another team either.
+    """
     return stable_hash({
         "provider": cfg.code_review.provider,
-        "model": cfg.code_review.model,
-        "max_tokens": cfg.code_review.max_tokens,
-        "max_source_chars": cfg.code_review.max_source_chars,
-        "prompt_preamble": cfg.code_review.prompt_preamble,
-        "review_sections": [
-            {"name": s.name, "instruction": s.instruction}
-            for s in cfg.code_review.review_sections
-        ],
+        "request": provider.code_review_request(ctx),
     })
 
 
-def _code_review_input_sig(sub: Submission, repo_dir: Path) -> str | None:
-    """Bind cache entry to the actual repo content + project description."""
-    from hackathon_reviewer.utils.llm_cache import repo_head_sha, stable_hash
-    sha = repo_head_sha(repo_dir)
-    if not sha:
-        return None
-    return stable_hash({"head": sha, "description": sub.description or ""})
+def _reused(resp: CodeReviewResponse) -> CodeReviewResponse:
+    """A response served from the prompt cache: no spend this run."""
+    return replace(resp, input_tokens=0, output_tokens=0)
+
+
+def _review_one(
+    provider: LLMProvider,
+    sub: Submission,
+    meta: RepoMetadata,
+    static: StaticAnalysisResult,
+    cfg: ReviewConfig,
+    reuse_cached: bool = True,
+) -> CodeReviewResult:
+    """Review one team, reusing a prompt-cached response unless `reuse_cached` is off.
+
+    A fresh response is cached either way, for later runs.
+    """
+    if not meta.clone_success:
+        return CodeReviewResult(
+            team_number=sub.team_number,
+            model_used=cfg.code_review.model,
+            error="repo_not_cloned",
+        )
+
+    ctx = _build_context(sub, meta, static, cfg)
+    cache, key = _prompt_cache(cfg), _prompt_key(provider, ctx, cfg)
+    cached = cache.load(key) if reuse_cached else None
+    if cached is not None:
+        return _to_result(sub, _reused(CodeReviewResponse(**cached)), cfg, ctx)
+
+    resp = provider.review_code(ctx)
+    if resp.success:
+        cache.save(key, asdict(resp))
+    return _to_result(sub, resp, cfg, ctx)
 
 
+async def _areview_one(
+    provider: LLMProvider,
+    sub: Submission,
+    meta: RepoMetadata,
+    static: StaticAnalysisResult,
+    cfg: ReviewConfig,
+    limiter: LLMRateLimiter | None = None,
+    reuse_cached: bool = True,
+) -> CodeReviewResult:
+    """Async `_review_one`: file reads go to a thread, the LLM call stays on the loop.
+
+    `limiter` holds each new request until the per-minute request/token
+    budgets allow.
+    """
+    if not meta.clone_success:
+        return _review_one(provider, sub, meta, static, cfg)
+
+    ctx = await asyncio.to_thread(_build_context, sub, meta, static, cfg)
+    cache, key = _prompt_cache(cfg), _prompt_key(provider, ctx, cfg)
+    cached = cache.load(key) if reuse_cached else None
+    if cached is not None:
+        return _to_result(sub, _reused(CodeReviewResponse(**cached)), cfg, ctx)
+
+    if limiter is None:
+        resp = await provider.areview_code(ctx)
+    else:
+        estimate = _estimate_prompt_tokens(ctx)
+        await limiter.acquire(estimate)
+        resp = await provider.areview_code(ctx)
+        limiter.settle(estimate, resp.input_tokens)
+    if resp.success:
+        cache.save(key, asdict(resp))
+    return _to_result(sub, resp, cfg, ctx)
+
+
+async def _review_concurrently(
+    provider: LLMProvider,
+    subs: list[Submission],
+    meta_by_team: dict[int, RepoMetadata],
+    static_by_team: dict[int, StaticAnalysisResult],
+    cfg: ReviewConfig,
+    workers: int,
+    on_result: Callable[[int, CodeReviewResult], None],
+    reuse_cached: bool = True,
+) -> None:
+    """Fan reviews out on one event loop, at most `workers` in flight."""
+    sem = asyncio.Semaphore(workers)
+    limiter = LLMRateLimiter(
+        cfg.concurrency.llm_requests_per_minute,
+        cfg.concurrency.llm_input_tokens_per_minute,
+    )
+
+    async def _one(sub: Submission) -> tuple[int, CodeReviewResult]:
+        async with sem:
+            meta = meta_by_team[sub.team_number]
+            static = static_by_team[sub.team_number]
+            return sub.team_number, await _areview_one(
+                provider, sub, meta, static, cfg, limiter, reuse_cached,
+            )
+
+    tasks = [asyncio.create_task(_one(sub)) for sub in subs]
+    for next_done in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Code review"):
+        on_result(*await next_done)
+
+
+def _batch_state_path(cfg: ReviewConfig) -> Path:
+    return cfg.data_dir / "code_review_batch.json"
+
+
+def _run_batch(
+    provider: LLMProvider,
+    contexts_by_key: dict[str, CodeReviewContext],
+    cfg: ReviewConfig,
+) -> list[CodeReviewResponse]:
+    """Submit (or re-attach to) one provider batch for these contexts.
+
+    The batch id is persisted next to the stage output until results are
+    in, so a crash or Ctrl-C while polling resumes the same job next run
+    instead of paying for it twice. The saved id is only reused when the
+    set of prompt keys is identical, and is dropped (and the batch
+    resubmitted) once the provider says it is gone.
+    """
+    keys = list(contexts_by_key)
+    contexts = list(contexts_by_key.values())
+    state_path = _batch_state_path(cfg)
+
+    def _failed(error: str) -> list[CodeReviewResponse]:
+        return [CodeReviewResponse(success=False, error=error) for _ in contexts]
+
+    def _collect(batch_id: str) -> list[CodeReviewResponse] | None:
+        """Responses for `batch_id`, or None if the batch is gone for good."""
+        try:
+            responses = provider.collect_batch(batch_id, contexts, keys)
+        except BatchGone as e:
+            state_path.unlink(missing_ok=True)
+            click.echo(f"  Batch {batch_id} can't be collected ({error_text(e)}).")
+            return None
+        except Exception as e:
+            # Keep the state file: the job may well still finish server-side.
+            click.echo(f"  Batch {batch_id} not collected ({error_text(e)}); re-run to resume.")
+            return _failed(error_text(e))
+        state_path.unlink(missing_ok=True)
+        return responses
+
+    if state_path.exists():
+        try:
+            state = json.loads(state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            state = {}
+        if state.get("provider") == cfg.code_review.provider and state.get("keys") == keys:
+            click.echo(f"  Re-attaching to batch {state.get('batch_id')}...")
+            responses = _collect(state.get("batch_id"))
+            if responses is not None:
+                return responses
+            click.echo("  Submitting a new batch instead.")
+
+    click.echo(f"  Submitting batch of {len(contexts)} reviews...")
+    try:
+        # Requests are tagged with their prompt keys, so results map back to
+        # the same requests whichever run re-attaches.
+        batch_id = provider.submit_batch(contexts, keys)
+    except Exception as e:
+        return _failed(error_text(e))
+    if batch_id is None:
+        return provider.review_code_batch(contexts)
+    # Atomic, so a crash mid-write can't leave an unreadable state file that
+    # makes the next run submit (and pay for) a second batch.
+    write_atomic(state_path, json.dumps({
+        "provider": cfg.code_review.provider,
+        "batch_id": batch_id,
+        "keys": keys,
+    }).encode())
+
+    responses = _collect(batch_id)
+    return responses if responses is not None else _failed("batch_not_found")
+
+
+def _review_batch(
+    provider: LLMProvider,
+    subs: list[Submission],
+    meta_by_team: dict[int, RepoMetadata],
+    static_by_team: dict[int, StaticAnalysisResult],
+    cfg: ReviewConfig,
+    reuse_cached: bool = True,
+) -> list[tuple[int, CodeReviewResult]]:
+    """Review all `subs` through the provider's batch endpoint."""
+    out: list[tuple[int, CodeReviewResult]] = []
+    batch_subs: list[Submission] = []
+    contexts: list[CodeReviewContext] = []
+    for sub in subs:
+        meta = meta_by_team[sub.team_number]
+        if not meta.clone_success:
+            out.append((sub.team_number, _review_one(provider, sub, meta, static_by_team[sub.team_number], cfg)))
+            continue
+        batch_subs.append(sub)
+        contexts.append(_build_context(sub, meta, static_by_team[sub.team_number], cfg))
+
+    cache = _prompt_cache(cfg)
+    pending: list[tuple[Submission, CodeReviewContext, str]] = []
+    for sub, ctx in zip(batch_subs, contexts):
+        key = _prompt_key(provider, ctx, cfg)
+        cached = cache.load(key) if reuse_cached else None
+        if cached is not None:
+            out.append((sub.team_number, _to_result(sub, _reused(CodeReviewResponse(**cached)), cfg, ctx)))
+        else:
+            pending.append((sub, ctx, key))
+
+    if pending:
+        contexts_by_key = {key: ctx for _, ctx, key in pending}
+        responses = dict(zip(contexts_by_key, _run_batch(provider, contexts_by_key, cfg)))
+        for sub, ctx, key in pending:
+            resp = responses[key]
+            if resp.success:
+                cache.save(key, asdict(resp))
+            out.append((sub.team_number, _to_result(sub, resp, cfg, ctx)))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Stage entry points
+# ---------------------------------------------------------------------------
+
 def run_code_review(
     cfg: ReviewConfig,
     submissions: list[Submission],
@@ -169,10 +437,12 @@ def run_code_review(
     resume: bool = True,
     progress: "Any | None" = None,
 ) -> list[CodeReviewResult]:
-    """Run LLM code review on all submissions in parallel, save to JSON."""
-    from hackathon_reviewer.utils.llm_cache import LLMCache
+    """Run LLM code review on all submissions in parallel, save to JSON.
 
-    workers = cfg.concurrency.llm_concurrent_requests
+    Fresh responses are reused from the prompt cache (`cfg.prompt_cache_dir`)
+    when the rendered request is unchanged, unless `resume` is off.
+    """
+    workers = min(cfg.concurrency.llm_concurrent_requests, MAX_LLM_CONCURRENCY)
     click.echo("\n--- Stage 5: LLM Code Review ---")
     click.echo(f"  Provider: {cfg.code_review.provider} ({cfg.code_review.model})")
     click.echo(f"  Workers: {workers}")
@@ -188,10 +458,6 @@ def run_code_review(
         existing = {r.team_number: r for r in _load_reviews_file(out_path)}
         click.echo(f"  Resuming: {len(existing)} already reviewed")
 
-    cache = LLMCache(cfg.cache_dir, "code_review")
-    config_sig = _code_review_config_sig(cfg)
-    cache_hits = 0
-
     results_map: dict[int, CodeReviewResult] = {}
     work: list[Submission] = []
 
@@ -208,68 +474,50 @@ def run_code_review(
             )
             continue
 
-        # Try the hackathon-level cache before scheduling the LLM call.
-        if cache.enabled and meta.clone_success:
-            from hackathon_reviewer.utils.cache_key import repo_cache_key
-            repo_dir = cfg.repos_dir / repo_cache_key(sub)
-            input_sig = _code_review_input_sig(sub, repo_dir)
-            if input_sig:
-                cached = cache.load(sub.team_number, config_sig, input_sig)
-                if cached is not None:
-                    try:
-                        results_map[sub.team_number] = CodeReviewResult(**cached)
-                        cache_hits += 1
-                        continue
-                    except Exception:
-                        # Corrupt cache entry — fall through to fresh review.
-                        pass
-
         work.append(sub)
 
-    if cache_hits:
-        click.echo(f"  Cache hits: {cache_hits} (skipping LLM)")
-
     total_input_tokens = 0
     total_output_tokens = 0
     start = time.time()
     completed = 0
 
-    def _do_one(sub: Submission) -> tuple[int, CodeReviewResult]:
-        meta = meta_by_team[sub.team_number]
-        static = static_by_team[sub.team_number]
-        return sub.team_number, _review_one(provider, sub, meta, static, cfg)
-
     total_submissions = len(submissions)
     skipped = total_submissions - len(work)
-
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        futures = {pool.submit(_do_one, sub): sub.team_number for sub in work}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Code review"):
-            team_num, result = future.result()
-            results_map[team_num] = result
-            if result.success:
-                total_input_tokens += result.input_tokens
-                total_output_tokens += result.output_tokens
-                # Save to hackathon-level cache for future re-runs.
-                if cache.enabled:
-                    sub = next((s for s in work if s.team_number == team_num), None)
-                    meta = meta_by_team.get(team_num)
-                    if sub and meta and meta.clone_success:
-                        from hackathon_reviewer.utils.cache_key import repo_cache_key
-                        repo_dir = cfg.repos_dir / repo_cache_key(sub)
-                        input_sig = _code_review_input_sig(sub, repo_dir)
-                        if input_sig:
-                            cache.save(team_num, config_sig, input_sig, result.model_dump(mode="json"))
-            completed += 1
-            if not result.success and progress:
-                sub = next((s for s in work if s.team_number == team_num), None)
-                if sub:
-                    progress.add_failure(team_num, sub.team_name, sub.project_name, result.error or "unknown")
-            if progress:
-                progress.update(skipped + completed, total_submissions, "")
-            if completed % 10 == 0:
-                with _save_lock:
-                    _save_results_map(results_map, submissions, out_path)
+    work_by_team = {s.team_number: s for s in work}
+    checkpoint = ListCheckpoint(submissions, out_path)
+    for team_num, result in results_map.items():
+        checkpoint.set(team_num, result)
+
+    def _record(team_num: int, result: CodeReviewResult) -> None:
+        nonlocal total_input_tokens, total_output_tokens, completed
+        results_map[team_num] = result
+        checkpoint.set(team_num, result)
+        if result.success:
+            total_input_tokens += result.input_tokens
+            total_output_tokens += result.output_tokens
+        completed += 1
+        if not result.success and progress:
+            sub = work_by_team.get(team_num)
+            if sub:
+                progress.add_failure(team_num, sub.team_name, sub.project_name, result.error or "unknown")
+        if progress:
+            progress.update(skipped + completed, total_submissions, "")
+        if completed % 10 == 0:
+            checkpoint.save()
+
+    try:
+        if cfg.code_review.batch_api and work:
+            for team_num, result in _review_batch(
+                provider, work, meta_by_team, static_by_team, cfg, reuse_cached=resume,
+            ):
+                _record(team_num, result)
+        else:
+            asyncio.run(_review_concurrently(
+                provider, work, meta_by_team, static_by_team, cfg, workers, _record,
+                reuse_cached=resume,
+            ))
+    finally:
+        checkpoint.close()
 
     results = [results_map.get(sub.team_number, CodeReviewResult(team_number=sub.team_number))
                for sub in submissions]
@@ -286,18 +534,11 @@ def run_code_review(
 
 
 def _save_reviews(results: list[CodeReviewResult], path: Path) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump([r.model_dump(mode="json") for r in results], f, indent=2, ensure_ascii=False)
-
-
-def _save_results_map(results_map: dict[int, CodeReviewResult], submissions: list[Submission], path: Path) -> None:
-    ordered = [results_map[s.team_number] for s in submissions if s.team_number in results_map]
-    _save_reviews(ordered, path)
+    dump_model_list(path, results, CodeReviewResult)
 
 
 def _load_reviews_file(path: Path) -> list[CodeReviewResult]:
-    with open(path) as f:
-        return [CodeReviewResult(**r) for r in json.load(f)]
+    return load_model_list(path, CodeReviewResult)
 
 
 def load_code_reviews(cfg: ReviewConfig) -> list[CodeReviewResult]:
@@ -3,9 +3,11 @@
 from __future__ import annotations
 
 import csv
-import json
+import itertools
 import re
+from collections.abc import Iterable, Iterator
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
@@ -21,12 +23,17 @@ from hackathon_reviewer.models import (
     VideoInfo,
     VideoPlatform,
 )
+from hackathon_reviewer.utils.json_io import dump_model_list, load_model_list
 
 
 # ---------------------------------------------------------------------------
 # URL validation
 # ---------------------------------------------------------------------------
 
+_TREE_SUFFIX_RE = re.compile(r"/tree/.*$")
+_BLOB_SUFFIX_RE = re.compile(r"/blob/.*$")
+_GIT_SUFFIX_RE = re.compile(r"\.git$")
+
 
 def classify_github_url(raw_url: str) -> GitHubInfo:
     url = raw_url.strip()
@@ -52,7 +59,7 @@ def classify_github_url(raw_url: str) -> GitHubInfo:
     # HuggingFace Spaces/repos are git-clonable
     if "huggingface.co" in parsed.netloc:
         info.cleaned = url
-        clone_url = re.sub(r"/tree/.*$", "", url).rstrip("/")
+        clone_url = _TREE_SUFFIX_RE.sub("", url).rstrip("/")
         info.clone_url = clone_url
         info.is_valid = True
         if "/tree/" in raw_url:
@@ -66,10 +73,10 @@ def classify_github_url(raw_url: str) -> GitHubInfo:
 
     info.cleaned = url
 
-    clone_url = re.sub(r"/tree/.*$", "", url)
-    clone_url = re.sub(r"/blob/.*$", "", clone_url)
+    clone_url = _TREE_SUFFIX_RE.sub("", url)
+    clone_url = _BLOB_SUFFIX_RE.sub("", clone_url)
     clone_url = clone_url.rstrip("/")
-    clone_url = re.sub(r"\.git$", "", clone_url)
+    clone_url = _GIT_SUFFIX_RE.sub("", clone_url)
 
     if "github.io" in url:
         info.issues.append("github_pages_not_repo")
@@ -161,6 +168,21 @@ def is_direct_video_url(url: str) -> bool:
     return path.endswith(_DIRECT_VIDEO_EXTENSIONS)
 
 
+VIDEO_PLATFORM_KEYWORDS: list[tuple[str, VideoPlatform]] = [
+    ("youtu.be", VideoPlatform.YOUTUBE),
+    ("youtube.com", VideoPlatform.YOUTUBE),
+    ("loom.com", VideoPlatform.LOOM),
+    ("vimeo.com", VideoPlatform.VIMEO),
+    ("drive.google.com", VideoPlatform.GOOGLE_DRIVE),
+    ("docs.google.com/video", VideoPlatform.GOOGLE_DRIVE),
+    ("dropbox.com", VideoPlatform.DROPBOX),
+    ("descript.com", VideoPlatform.DESCRIPT),
+    ("screen.studio", VideoPlatform.SCREEN_STUDIO),
+]
+_VIDEO_KEYWORD_RANK = {kw: i for i, (kw, _) in enumerate(VIDEO_PLATFORM_KEYWORDS)}
+_VIDEO_PLATFORM_RE = re.compile("|".join(re.escape(kw) for kw, _ in VIDEO_PLATFORM_KEYWORDS))
+
+
 def classify_video_url(raw_url: str) -> VideoInfo:
     url = raw_url.strip()
     info = VideoInfo(original=url)
@@ -192,21 +214,15 @@ def classify_video_url(raw_url: str) -> VideoInfo:
         )
         return info
 
-    platform_checks: list[tuple[list[str], VideoPlatform]] = [
-        (["youtu.be", "youtube.com"], VideoPlatform.YOUTUBE),
-        (["loom.com"], VideoPlatform.LOOM),
-        (["vimeo.com"], VideoPlatform.VIMEO),
-        (["drive.google.com", "docs.google.com/video"], VideoPlatform.GOOGLE_DRIVE),
-        (["dropbox.com"], VideoPlatform.DROPBOX),
-        (["descript.com"], VideoPlatform.DESCRIPT),
-        (["screen.studio"], VideoPlatform.SCREEN_STUDIO),
-    ]
-
-    for keywords, platform in platform_checks:
-        if any(kw in lower for kw in keywords):
-            info.platform = platform
-            info.is_valid = True
-            break
+    # A URL mentioning several platforms resolves to the earliest entry in
+    # VIDEO_PLATFORM_KEYWORDS, not the leftmost match.
+    matched = min(
+        (_VIDEO_KEYWORD_RANK[kw] for kw in _VIDEO_PLATFORM_RE.findall(lower)),
+        default=None,
+    )
+    if matched is not None:
+        info.platform = VIDEO_PLATFORM_KEYWORDS[matched][1]
+        info.is_valid = True
     else:
         if "example.com" in lower:
             info.platform = VideoPlatform.UNKNOWN
@@ -230,15 +246,26 @@ def classify_video_url(raw_url: str) -> VideoInfo:
 # ---------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4)
+def _parse_deadline(deadline_utc: str) -> datetime | None:
+    """Parse the configured deadline once rather than once per row."""
+    try:
+        return datetime.fromisoformat(deadline_utc)
+    except (ValueError, TypeError):
+        return None
+
+
 def compute_lateness(timestamp_str: str, cfg: ReviewConfig) -> TimingInfo:
     timing = TimingInfo(submitted_utc=timestamp_str.strip())
 
     if not cfg.hackathon or not cfg.hackathon.deadline_utc:
         return timing
 
+    deadline = _parse_deadline(cfg.hackathon.deadline_utc)
+    if deadline is None:
+        return timing
     try:
         ts = datetime.fromisoformat(timestamp_str.strip())
-        deadline = datetime.fromisoformat(cfg.hackathon.deadline_utc)
     except (ValueError, TypeError):
         return timing
 
@@ -312,10 +339,17 @@ def _auto_detect_columns(headers: list[str]) -> dict[str, str | None]:
 # Parsing
 # ---------------------------------------------------------------------------
 
+# Submission CSVs carry long free-text descriptions; read them in big chunks.
+CSV_READ_BUFFER = 1024 * 1024
+
+_MEMBER_RE = re.compile(r"([^(,]+?)\s*\(([^)]+)\)")
+_NON_NAME_CHAR_RE = re.compile(r"[^a-zA-Z0-9_-]")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
 
 def _parse_members(raw: str) -> list[TeamMember]:
     members = []
-    for match in re.finditer(r"([^(,]+?)\s*\(([^)]+)\)", raw):
+    for match in _MEMBER_RE.finditer(raw):
         members.append(
             TeamMember(name=match.group(1).strip(), email=match.group(2).strip())
         )
@@ -325,58 +359,87 @@ def _parse_members(raw: str) -> list[TeamMember]:
 
 
 def _sanitize_name(name: str) -> str:
-    s = re.sub(r"[^a-zA-Z0-9_-]", "_", name.lower())
-    s = re.sub(r"_+", "_", s).strip("_")
+    s = _NON_NAME_CHAR_RE.sub("_", name.lower())
+    s = _UNDERSCORE_RUN_RE.sub("_", s).strip("_")
     return s[:50]
 
 
+def _is_header_line(line: str) -> bool:
+    stripped = line.strip().rstrip(",")
+    # Skip empty lines and section labels (single-cell rows)
+    return bool(stripped) and "," in stripped
+
+
 def _find_header_row(filepath: Path) -> int:
     """Find the actual CSV header row, skipping section labels like 'PROJECTS TABLE'."""
     with open(filepath, "r", encoding="utf-8") as f:
         for i, line in enumerate(f):
-            stripped = line.strip().rstrip(",")
-            # Skip empty lines and section labels (single-cell rows)
-            if not stripped or "," not in stripped:
-                continue
-            return i
+            if _is_header_line(line):
+                return i
     return 0
 
 
 def parse_csv(cfg: ReviewConfig) -> list[Submission]:
     """Parse the submissions CSV using column mapping from config."""
-    if not cfg.csv_path or not cfg.csv_path.exists():
-        raise FileNotFoundError(f"CSV not found: {cfg.csv_path}")
+    return list(iter_csv_submissions(cfg))
 
-    skip_rows = _find_header_row(cfg.csv_path)
 
-    with open(cfg.csv_path, "r", encoding="utf-8") as f:
-        for _ in range(skip_rows):
-            next(f)
-        reader = csv.DictReader(f)
-        headers = reader.fieldnames or []
+def iter_csv_submissions(cfg: ReviewConfig) -> Iterator[Submission]:
+    """Yield submissions one CSV row at a time.
 
-        # Build effective column mapping
+    The header row is located on the same file handle the rows are read
+    from, so the CSV is opened and scanned once.
+    """
+    if not cfg.csv_path or not cfg.csv_path.exists():
+        raise FileNotFoundError(f"CSV not found: {cfg.csv_path}")
+
+    # newline="" hands line endings to the csv module untranslated, which is
+    # what it expects (and keeps newlines inside quoted fields intact).
+    with open(cfg.csv_path, "r", encoding="utf-8", newline="", buffering=CSV_READ_BUFFER) as f:
+        lines: Iterable[str] = f
+        for line in f:
+            if _is_header_line(line):
+                lines = itertools.chain([line], f)
+                break
+        else:
+            f.seek(0)
+        reader = csv.reader(lines)
+        headers = next(reader, [])
+        width = len(headers)
+        # Header -> cell index; a duplicated header resolves to its last
+        # column, as DictReader did.
+        pos = {h: i for i, h in enumerate(headers)}
+
+        # Build effective column mapping once: per field, the cell indexes to
+        # try in order (configured override first, then the auto-detected one).
         col = cfg.columns
         auto = _auto_detect_columns(headers)
-
-        def _get(row: dict, field: str, fallback: str | None = None) -> str:
-            configured = getattr(col, field, None)
-            if configured and configured in row and row[configured]:
-                return row[configured].strip()
-            if fallback and fallback in row and row[fallback]:
-                return row[fallback].strip()
-            auto_col = auto.get(field)
-            if auto_col and auto_col in row and row[auto_col]:
-                return row[auto_col].strip()
+        sources: dict[str, tuple[int, ...]] = {
+            field: tuple(dict.fromkeys(
+                pos[c] for c in (getattr(col, field, None), auto.get(field)) if c and c in pos
+            ))
+            for field in COLUMN_ALIASES
+        }
+        extra_cols = [(c, pos[c]) for c in col.extra if c in pos]
+        hf_cols = [pos[c] for c in ("Hugging Face Spaces Link", "Hugging Face Link") if c in pos]
+
+        def _get(row: list[str], field: str) -> str:
+            for i in sources[field]:
+                value = row[i]
+                if value:
+                    return value.strip()
             return ""
 
-        submissions: list[Submission] = []
+        # Blank lines are skipped without consuming a team number.
+        rows = (row for row in reader if row)
+        for idx, row in enumerate(rows, start=1):
+            if len(row) < width:
+                row += [""] * (width - len(row))
 
-        for idx, row in enumerate(reader, start=1):
             # Stop at section breaks (e.g. "SCORES TABLE")
-            first_val = next((v for v in row.values() if v and v.strip()), "")
-            if first_val.endswith("TABLE") or not any(v and v.strip() for v in row.values()):
-                break
+            first_val = next((v for v in row if v.strip()), "")
+            if not first_val or first_val.endswith("TABLE"):
+                return
 
             team_name = _get(row, "team_name")
             project_name = _get(row, "project_name") or team_name
@@ -387,13 +450,13 @@ def parse_csv(cfg: ReviewConfig) -> list[Submission]:
 
             github_raw = _get(row, "github_url")
             if not github_raw:
-                all_text = " ".join(v for v in row.values() if v)
+                all_text = " ".join(v for v in row if v)
                 github_raw = _extract_github_url_from_text(all_text) or ""
             if not github_raw:
                 # Fall back to HF Spaces link as a clonable repo
-                for hf_col in ("Hugging Face Spaces Link", "Hugging Face Link"):
-                    if hf_col in row and row[hf_col] and "huggingface.co" in row[hf_col]:
-                        github_raw = row[hf_col].strip()
+                for i in hf_cols:
+                    if "huggingface.co" in row[i]:
+                        github_raw = row[i].strip()
                         break
             github = classify_github_url(github_raw)
             video = classify_video_url(_get(row, "video_url"))
@@ -403,28 +466,21 @@ def parse_csv(cfg: ReviewConfig) -> list[Submission]:
                 compute_lateness(submitted_at, cfg) if submitted_at else TimingInfo()
             )
 
-            extra: dict[str, str] = {}
-            for extra_col in col.extra:
-                if extra_col in row:
-                    extra[extra_col] = row[extra_col].strip()
-
-            submissions.append(
-                Submission(
-                    team_number=idx,
-                    team_name=team_name,
-                    project_name=project_name,
-                    sanitized_name=sanitized,
-                    members=members,
-                    description=_get(row, "description"),
-                    github=github,
-                    video=video,
-                    timing=timing,
-                    extra_fields=extra,
-                )
+            extra = {c: row[i].strip() for c, i in extra_cols}
+
+            yield Submission(
+                team_number=idx,
+                team_name=team_name,
+                project_name=project_name,
+                sanitized_name=sanitized,
+                members=members,
+                description=_get(row, "description"),
+                github=github,
+                video=video,
+                timing=timing,
+                extra_fields=extra,
             )
 
-    return submissions
-
 
 # ---------------------------------------------------------------------------
 # Stage entry points
@@ -447,13 +503,7 @@ def run_parse(cfg: ReviewConfig) -> list[Submission]:
         click.echo(f"  Late submissions:  {late}")
 
     out_path = cfg.data_dir / "submissions.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(
-            [s.model_dump(mode="json") for s in submissions],
-            f,
-            indent=2,
-            ensure_ascii=False,
-        )
+    dump_model_list(out_path, submissions, Submission)
     click.echo(f"  Saved to {out_path}")
 
     return submissions
@@ -464,5 +514,4 @@ def load_submissions(cfg: ReviewConfig) -> list[Submission]:
     path = cfg.data_dir / "submissions.json"
     if not path.exists():
         raise FileNotFoundError(f"{path} not found. Run the parse stage first.")
-    with open(path) as f:
-        return [Submission(**s) for s in json.load(f)]
+    return load_model_list(path, Submission)
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import csv
 import json
+from collections import Counter
+from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -23,6 +26,12 @@ from hackathon_reviewer.models import (
 )
 
 
+@lru_cache(maxsize=256)
+def _title(key: str) -> str:
+    """Display form of a flag type or criterion key: `ai_use` -> `Ai Use`."""
+    return key.replace("_", " ").title()
+
+
 # ---------------------------------------------------------------------------
 # Flag collection
 # ---------------------------------------------------------------------------
@@ -38,58 +47,46 @@ def _collect_flags(
     video_map = {v.team_number: v for v in video_results}
 
     for sub in submissions:
-        meta = meta_map.get(sub.team_number)
-        video = video_map.get(sub.team_number)
+        tn, name, pname = sub.team_number, sub.team_name, sub.project_name
+        meta = meta_map.get(tn)
+        video = video_map.get(tn)
+
+        def mk(flag_type: str, description: str, severity: str) -> ProjectFlag:
+            return ProjectFlag(
+                team_number=tn, team_name=name, project_name=pname,
+                flag_type=flag_type, description=description, severity=severity,
+            )
 
         # GitHub issues
         if not sub.github.is_valid:
-            flags.append(ProjectFlag(
-                team_number=sub.team_number,
-                team_name=sub.team_name,
-                project_name=sub.project_name,
-                flag_type="invalid_github_url",
-                description=f"GitHub URL invalid: {', '.join(sub.github.issues)}",
-                severity="error",
+            flags.append(mk(
+                "invalid_github_url",
+                f"GitHub URL invalid: {', '.join(sub.github.issues)}",
+                "error",
             ))
         elif meta and not meta.clone_success:
-            flags.append(ProjectFlag(
-                team_number=sub.team_number,
-                team_name=sub.team_name,
-                project_name=sub.project_name,
-                flag_type="clone_failed",
-                description=f"Could not clone repo: {meta.clone_error}",
-                severity="error",
-            ))
+            flags.append(mk("clone_failed", f"Could not clone repo: {meta.clone_error}", "error"))
 
         # Video issues
         if not sub.video.is_valid:
-            flags.append(ProjectFlag(
-                team_number=sub.team_number,
-                team_name=sub.team_name,
-                project_name=sub.project_name,
-                flag_type="invalid_video_url",
-                description=f"Video URL invalid: {', '.join(sub.video.issues)}",
-                severity="error",
+            flags.append(mk(
+                "invalid_video_url",
+                f"Video URL invalid: {', '.join(sub.video.issues)}",
+                "error",
             ))
         elif video and not video.download.success:
-            flags.append(ProjectFlag(
-                team_number=sub.team_number,
-                team_name=sub.team_name,
-                project_name=sub.project_name,
-                flag_type="video_download_failed",
-                description=f"Could not download video: {video.download.error}",
-                severity="error",
+            flags.append(mk(
+                "video_download_failed",
+                f"Could not download video: {video.download.error}",
+                "error",
             ))
 
         # Video unrelated to project
         if video and video.analysis_success and not video.is_related_to_project:
-            flags.append(ProjectFlag(
-                team_number=sub.team_number,
-                team_name=sub.team_name,
-                project_name=sub.project_name,
-                flag_type="video_unrelated",
-                description="Video does not appear related to the project description",
-                severity="warning",
+            flags.append(mk(
+                "video_unrelated",
+                "Video does not appear related to the project description",
+                "warning",
             ))
 
         # Hackathon-specific flags
@@ -98,37 +95,28 @@ def _collect_flags(
                 LatenessCategory.MODERATELY_LATE,
                 LatenessCategory.SIGNIFICANTLY_LATE,
             ):
-                flags.append(ProjectFlag(
-                    team_number=sub.team_number,
-                    team_name=sub.team_name,
-                    project_name=sub.project_name,
-                    flag_type="late_submission",
-                    description=f"Submitted {sub.timing.minutes_late:.0f} min late ({sub.timing.lateness_category.value})",
-                    severity="warning",
+                flags.append(mk(
+                    "late_submission",
+                    f"Submitted {sub.timing.minutes_late:.0f} min late ({sub.timing.lateness_category.value})",
+                    "warning",
                 ))
 
             if meta and meta.git_history.hackathon_period_flag in (
                 HackathonPeriodFlag.SIGNIFICANT_PRIOR_WORK,
                 HackathonPeriodFlag.PRE_EXISTING_PROJECT,
             ):
-                flags.append(ProjectFlag(
-                    team_number=sub.team_number,
-                    team_name=sub.team_name,
-                    project_name=sub.project_name,
-                    flag_type="git_period_violation",
-                    description=f"Git history flag: {meta.git_history.hackathon_period_flag.value} "
-                                f"({meta.git_history.commits_before_hackathon} commits before hackathon)",
-                    severity="warning",
+                flags.append(mk(
+                    "git_period_violation",
+                    f"Git history flag: {meta.git_history.hackathon_period_flag.value} "
+                    f"({meta.git_history.commits_before_hackathon} commits before hackathon)",
+                    "warning",
                 ))
 
             if meta and meta.git_history.is_single_commit_dump:
-                flags.append(ProjectFlag(
-                    team_number=sub.team_number,
-                    team_name=sub.team_name,
-                    project_name=sub.project_name,
-                    flag_type="single_commit_dump",
-                    description="Repository has only a single commit (possible squash or copy-paste)",
-                    severity="info",
+                flags.append(mk(
+                    "single_commit_dump",
+                    "Repository has only a single commit (possible squash or copy-paste)",
+                    "info",
                 ))
 
     return flags
@@ -152,7 +140,7 @@ def _write_flags_report(flags: list[ProjectFlag], path: Path) -> None:
 
     for flag_type, items in sorted(by_type.items()):
         severity = items[0].severity.upper()
-        lines.append(f"## {flag_type.replace('_', ' ').title()} [{severity}] ({len(items)})")
+        lines.append(f"## {_title(flag_type)} [{severity}] ({len(items)})")
         lines.append("")
         lines.append("| # | Team | Project | Details |")
         lines.append("|---|---|---|---|")
@@ -168,6 +156,9 @@ def _write_flags_report(flags: list[ProjectFlag], path: Path) -> None:
 # Leaderboard CSV
 # ---------------------------------------------------------------------------
 
+# `scores` arrive ranked: run_scoring sorts them by weighted_total, best
+# first, before saving, and the summary's Top 20 relies on that too.
+
 def _write_leaderboard(
     scores: list[ProjectScore],
     submissions: list[Submission],
@@ -182,42 +173,47 @@ def _write_leaderboard(
     meta_map = {m.team_number: m for m in repo_metadata}
     static_map = {s.team_number: s for s in static_results}
 
-    sorted_scores = sorted(scores, key=lambda s: s.weighted_total, reverse=True)
-
-    rows = []
-    for rank, ps in enumerate(sorted_scores, 1):
-        sub = sub_map.get(ps.team_number)
-        meta = meta_map.get(ps.team_number)
-        static = static_map.get(ps.team_number)
-
-        row = {
-            "rank": rank,
-            "team_number": ps.team_number,
-            "team_name": ps.team_name,
-            "project_name": ps.project_name,
-            "weighted_total": ps.weighted_total,
-        }
-        for crit_name, crit_score in ps.scores.items():
-            row[crit_name] = crit_score.score
-
-        if meta:
-            row["total_loc"] = meta.files.total_loc
-            row["primary_language"] = meta.files.primary_language
-            row["commits"] = meta.git_history.total_commits
-        if static:
-            row["integration_depth"] = static.integration_depth.value
-        if sub:
-            row["github_url"] = sub.github.original
-            row["video_url"] = sub.video.original
-
-        rows.append(row)
-
-    if rows:
-        fieldnames = list(rows[0].keys())
-        with open(path, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(rows)
+    # Fixed column layout, resolved once: criteria in first-seen order (the
+    # top-ranked project's first), then the optional metadata groups if any
+    # row has them. Rows are written positionally, missing cells left blank.
+    criteria = list(dict.fromkeys(c for ps in scores for c in ps.scores))
+    ranked = [ps.team_number for ps in scores]
+    with_meta = any(t in meta_map for t in ranked)
+    with_static = any(t in static_map for t in ranked)
+    with_sub = any(t in sub_map for t in ranked)
+
+    header = ["rank", "team_number", "team_name", "project_name", "weighted_total", *criteria]
+    if with_meta:
+        header += ["total_loc", "primary_language", "commits"]
+    if with_static:
+        header.append("integration_depth")
+    if with_sub:
+        header += ["github_url", "video_url"]
+
+    def _rows() -> Iterator[list]:
+        for rank, ps in enumerate(scores, 1):
+            sub = sub_map.get(ps.team_number)
+            meta = meta_map.get(ps.team_number)
+            static = static_map.get(ps.team_number)
+
+            row = [rank, ps.team_number, ps.team_name, ps.project_name, ps.weighted_total]
+            row += [ps.scores[c].score if c in ps.scores else "" for c in criteria]
+            if with_meta:
+                row += (
+                    [meta.files.total_loc, meta.files.primary_language, meta.git_history.total_commits]
+                    if meta else ["", "", ""]
+                )
+            if with_static:
+                row.append(static.integration_depth.value if static else "")
+            if with_sub:
+                row += [sub.github.original, sub.video.original] if sub else ["", ""]
+            yield row
+
+    # Rows are generated as the writer consumes them; none are held in memory.
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(_rows())
 
 
 # ---------------------------------------------------------------------------
@@ -231,7 +227,7 @@ def _write_project_report(
     code_review: CodeReviewResult | None,
     video: VideoAnalysisResult | None,
     score: ProjectScore | None,
-    flags: list[ProjectFlag],
+    project_flags: list[ProjectFlag],
     path: Path,
 ) -> None:
     lines = [
@@ -249,7 +245,6 @@ def _write_project_report(
     lines.append("")
 
     # Flags
-    project_flags = [f for f in flags if f.team_number == sub.team_number]
     if project_flags:
         lines.append("## Flags")
         lines.append("")
@@ -265,7 +260,7 @@ def _write_project_report(
         lines.append("| Criterion | Score | Source |")
         lines.append("|---|---|---|")
         for crit_name, crit_score in score.scores.items():
-            lines.append(f"| {crit_name.replace('_', ' ').title()} | {crit_score.score:.1f}/10 | {crit_score.source} |")
+            lines.append(f"| {_title(crit_name)} | {crit_score.score:.1f}/10 | {crit_score.source} |")
         lines.append("")
 
     # Description
@@ -280,6 +275,9 @@ def _write_project_report(
         lines.append("")
         lines.append(code_review.review_text)
         lines.append("")
+        if code_review.truncated:
+            lines.append("*Note: source files or transcript were truncated to fit the review prompt budget.*")
+            lines.append("")
 
     # Video analysis
     if video and video.analysis_success:
@@ -341,8 +339,10 @@ def _write_summary(
 ) -> None:
     total = len(submissions)
     cloned = sum(1 for m in repo_metadata if m.clone_success)
-    videos_ok = sum(1 for v in video_results if v.download.success)
-    analyzed = sum(1 for v in video_results if v.analysis_success)
+    videos_ok = analyzed = 0
+    for v in video_results:
+        videos_ok += v.download.success
+        analyzed += v.analysis_success
 
     lines = [
         "# hackathon-reviewer — Pipeline Summary",
@@ -367,14 +367,12 @@ def _write_summary(
             lines.append(f"| {i} | {ps.team_name[:25]} | {ps.project_name[:30]} | {ps.weighted_total:.1f} |")
         lines.append("")
 
-    flag_counts: dict[str, int] = {}
-    for f in flags:
-        flag_counts[f.flag_type] = flag_counts.get(f.flag_type, 0) + 1
+    flag_counts = Counter(f.flag_type for f in flags)
     if flag_counts:
         lines.append("## Flag Summary")
         lines.append("")
         for ft, count in sorted(flag_counts.items(), key=lambda x: -x[1]):
-            lines.append(f"- **{ft.replace('_', ' ').title()}:** {count}")
+            lines.append(f"- **{_title(ft)}:** {count}")
         lines.append("")
 
     with open(path, "w", encoding="utf-8") as f:
@@ -398,17 +396,14 @@ def run_reporting(
     """Generate all reports."""
     click.echo("\n--- Stage 8: Report Generation ---")
 
-    meta_map = {m.team_number: m for m in repo_metadata}
-    static_map = {s.team_number: s for s in static_results}
-    review_map = {r.team_number: r for r in code_reviews}
-    video_map = {v.team_number: v for v in video_results}
-    score_map = {s.team_number: s for s in scores}
-
     total = len(submissions) + 2
     done = 0
 
     # Collect flags
     flags = _collect_flags(submissions, repo_metadata, video_results, cfg)
+    flags_by_team: dict[int, list[ProjectFlag]] = {}
+    for f in flags:
+        flags_by_team.setdefault(f.team_number, []).append(f)
 
     # Flags report
     flags_path = cfg.reports_dir / "flags.md"
@@ -430,6 +425,11 @@ def run_reporting(
     # Per-project reports
     projects_dir = cfg.reports_dir / "projects"
     projects_dir.mkdir(parents=True, exist_ok=True)
+    meta_map = {m.team_number: m for m in repo_metadata}
+    static_map = {s.team_number: s for s in static_results}
+    review_map = {r.team_number: r for r in code_reviews}
+    video_map = {v.team_number: v for v in video_results}
+    score_map = {s.team_number: s for s in scores}
     for sub in submissions:
         report_path = projects_dir / f"{sub.sanitized_name}.md"
         _write_project_report(
@@ -439,7 +439,7 @@ def run_reporting(
             review_map.get(sub.team_number),
             video_map.get(sub.team_number),
             score_map.get(sub.team_number),
-            flags,
+            flags_by_team.get(sub.team_number, []),
             report_path,
         )
         done += 1
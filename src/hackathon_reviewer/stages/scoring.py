@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import math
+from collections.abc import Callable
 from pathlib import Path
 
 import click
@@ -20,13 +22,32 @@ from hackathon_reviewer.models import (
     Submission,
     VideoAnalysisResult,
 )
+from hackathon_reviewer.utils.json_io import dump_model_list, load_model_list
+from hackathon_reviewer.utils.llm_cache import stable_hash
+
+# Stage outputs that feed scoring; a change to any of them (or to the
+# scoring config) invalidates scores.json.
+SCORING_INPUT_FILES = (
+    "submissions.json",
+    "repo_metadata.json",
+    "static_analysis.json",
+    "code_reviews.json",
+    "video_analysis.json",
+)
+
+
+# log(midpoint + 1) for the midpoints the heuristics below use.
+_LOG_MIDPOINTS = {m: math.log(m + 1) for m in (50, 60, 5000, 10000)}
 
 
 def _log_scale(value: float, midpoint: float, steepness: float = 1.0) -> float:
     """Sigmoid-like scaling: maps value to 0-1 with midpoint at 0.5."""
     if value <= 0:
         return 0.0
-    return 1.0 / (1.0 + math.exp(-steepness * (math.log(value + 1) - math.log(midpoint + 1))))
+    log_mid = _LOG_MIDPOINTS.get(midpoint)
+    if log_mid is None:
+        log_mid = math.log(midpoint + 1)
+    return 1.0 / (1.0 + math.exp(-steepness * (math.log(value + 1) - log_mid)))
 
 
 # ---------------------------------------------------------------------------
@@ -34,19 +55,20 @@ def _log_scale(value: float, midpoint: float, steepness: float = 1.0) -> float:
 # ---------------------------------------------------------------------------
 
 def _heuristic_impact(sub: Submission, meta: RepoMetadata, static: StaticAnalysisResult) -> float:
+    files, struct = meta.files, static.structure
     score = 0.0
     desc = sub.description
     score += min(2.0, len(desc.split()) / 80)
-    score += _log_scale(meta.files.total_loc, 5000, 1.2) * 2.5
-    score += min(1.0, len(static.structure.frameworks_detected) * 0.4)
-    if meta.files.has_readme:
+    score += _log_scale(files.total_loc, 5000, 1.2) * 2.5
+    score += min(1.0, len(struct.frameworks_detected) * 0.4)
+    if files.has_readme:
         score += 1.0
     deploy = 0
-    if static.structure.has_docker:
+    if struct.has_docker:
         deploy += 0.5
-    if static.structure.has_ci:
+    if struct.has_ci:
         deploy += 0.5
-    if static.structure.has_env_example:
+    if struct.has_env_example:
         deploy += 0.5
     score += deploy
     return max(1.0, min(10.0, score))
@@ -72,32 +94,35 @@ def _heuristic_ai_use(static: StaticAnalysisResult) -> float:
     return max(1.0, min(8.0, base + bonus))
 
 
+_NON_CODE_LANGUAGES = frozenset({"Markdown", "JSON", "YAML", "TOML"})
+
+
 def _heuristic_depth(meta: RepoMetadata, static: StaticAnalysisResult) -> float:
+    files, history, struct = meta.files, meta.git_history, static.structure
     score = 0.0
-    commits = meta.git_history.commits_during_hackathon or meta.git_history.total_commits
+    commits = history.commits_during_hackathon or history.total_commits
     score += _log_scale(commits, 50, 1.0) * 2.5
-    score += _log_scale(meta.files.total_loc, 10000, 1.0) * 2.0
-    if meta.files.has_tests:
+    score += _log_scale(files.total_loc, 10000, 1.0) * 2.0
+    if files.has_tests:
         score += 1.0
-    if static.structure.has_claude_md:
+    if struct.has_claude_md:
         score += 0.5
-    if meta.files.has_readme:
+    if files.has_readme:
         score += 0.5
-    code_langs = {k: v for k, v in meta.files.languages.items()
-                  if k not in {"Markdown", "JSON", "YAML", "TOML"}}
-    if len(code_langs) >= 3:
+    code_langs = sum(1 for k in files.languages if k not in _NON_CODE_LANGUAGES)
+    if code_langs >= 3:
         score += 0.5
-    if static.structure.has_docker:
+    if struct.has_docker:
         score += 0.5
-    if static.structure.has_ci:
+    if struct.has_ci:
         score += 0.5
-    score += _log_scale(meta.files.file_count, 50, 1.0)
+    score += _log_scale(files.file_count, 50, 1.0)
 
-    if meta.git_history.is_single_commit_dump:
+    if history.is_single_commit_dump:
         score -= 2.0
     if static.is_boilerplate_heavy:
         score -= 2.0
-    flag = meta.git_history.hackathon_period_flag
+    flag = history.hackathon_period_flag
     if flag == HackathonPeriodFlag.PRE_EXISTING_PROJECT:
         score -= 3.0
     elif flag == HackathonPeriodFlag.SIGNIFICANT_PRIOR_WORK:
@@ -122,6 +147,18 @@ def _heuristic_demo(video: VideoAnalysisResult | None) -> float:
     return max(1.0, min(8.0, score))
 
 
+# Criterion name -> heuristic, all called as (sub, meta, static, video).
+# Criteria without an entry fall back to a neutral 5.0.
+HEURISTICS: dict[str, Callable[
+    [Submission, RepoMetadata, StaticAnalysisResult, VideoAnalysisResult | None], float,
+]] = {
+    "impact": lambda sub, meta, static, video: _heuristic_impact(sub, meta, static),
+    "ai_use": lambda sub, meta, static, video: _heuristic_ai_use(static),
+    "depth": lambda sub, meta, static, video: _heuristic_depth(meta, static),
+    "demo": lambda sub, meta, static, video: _heuristic_demo(video),
+}
+
+
 # ---------------------------------------------------------------------------
 # Score merging logic
 # ---------------------------------------------------------------------------
@@ -134,21 +171,18 @@ def _score_one(
     video: VideoAnalysisResult | None,
     cfg: ReviewConfig,
 ) -> ProjectScore:
-    ps = ProjectScore(
-        team_number=sub.team_number,
-        team_name=sub.team_name,
-        project_name=sub.project_name,
-    )
+    tn, name, pname = sub.team_number, sub.team_name, sub.project_name
+    ps = ProjectScore(team_number=tn, team_name=name, project_name=pname)
 
     if not cfg.scoring or not cfg.scoring.criteria:
         return ps
 
     criteria = cfg.scoring.criteria
     _meta = meta or RepoMetadata(
-        team_number=sub.team_number, team_name=sub.team_name,
-        project_name=sub.project_name, sanitized_name=sub.sanitized_name,
+        team_number=tn, team_name=name,
+        project_name=pname, sanitized_name=sub.sanitized_name,
     )
-    _static = static or StaticAnalysisResult(team_number=sub.team_number)
+    _static = static or StaticAnalysisResult(team_number=tn)
 
     for crit_name, crit_cfg in criteria.items():
         # Prefer LLM scores if available
@@ -165,14 +199,8 @@ def _score_one(
             )
         else:
             # Fall back to heuristic
-            heuristic_map = {
-                "impact": lambda: _heuristic_impact(sub, _meta, _static),
-                "ai_use": lambda: _heuristic_ai_use(_static),
-                "depth": lambda: _heuristic_depth(_meta, _static),
-                "demo": lambda: _heuristic_demo(video),
-            }
-            fn = heuristic_map.get(crit_name)
-            val = fn() if fn else 5.0
+            fn = HEURISTICS.get(crit_name)
+            val = fn(sub, _meta, _static, video) if fn else 5.0
             ps.scores[crit_name] = CriterionScore(
                 score=round(val, 1),
                 source="heuristic",
@@ -231,8 +259,10 @@ def run_scoring(
     scores.sort(key=lambda s: s.weighted_total, reverse=True)
 
     out_path = cfg.data_dir / "scores.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump([s.model_dump(mode="json") for s in scores], f, indent=2, ensure_ascii=False)
+    dump_model_list(out_path, scores, ProjectScore)
+    _scores_meta_path(cfg).write_text(
+        json.dumps({"inputs_signature": _scoring_inputs_signature(cfg)}), encoding="utf-8",
+    )
 
     click.echo(f"  Scored {len(scores)} submissions")
     if scores:
@@ -248,5 +278,36 @@ def load_scores(cfg: ReviewConfig) -> list[ProjectScore]:
     path = cfg.data_dir / "scores.json"
     if not path.exists():
         return []
-    with open(path) as f:
-        return [ProjectScore(**s) for s in json.load(f)]
+    return load_model_list(path, ProjectScore)
+
+
+def _scores_meta_path(cfg: ReviewConfig) -> Path:
+    return cfg.data_dir / "scores.meta.json"
+
+
+def _scoring_inputs_signature(cfg: ReviewConfig) -> str:
+    """Hash of the scoring config plus the bytes of every input stage file."""
+    digests = {}
+    for name in SCORING_INPUT_FILES:
+        path = cfg.data_dir / name
+        digests[name] = hashlib.sha256(path.read_bytes()).hexdigest() if path.exists() else None
+    scoring = cfg.scoring.model_dump(mode="json") if cfg.scoring else None
+    return stable_hash({"scoring": scoring, "inputs": digests})
+
+
+def load_fresh_scores(cfg: ReviewConfig) -> list[ProjectScore] | None:
+    """Saved scores, if they were computed from the current inputs and config.
+
+    Returns None when scores.json is missing or stale, so callers know to
+    re-run scoring.
+    """
+    meta_path = _scores_meta_path(cfg)
+    if not (cfg.data_dir / "scores.json").exists() or not meta_path.exists():
+        return None
+    try:
+        saved = json.loads(meta_path.read_text(encoding="utf-8")).get("inputs_signature")
+    except (OSError, ValueError, AttributeError):
+        return None
+    if saved != _scoring_inputs_signature(cfg):
+        return None
+    return load_scores(cfg)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-import json
 import os
 import re
+import subprocess
+from concurrent.futures import as_completed
+from functools import lru_cache
 from pathlib import Path
 
 import click
@@ -19,29 +21,31 @@ from hackathon_reviewer.models import (
     StaticAnalysisResult,
     Submission,
 )
+from hackathon_reviewer.utils.json_io import dump_model_list, load_model_list
+from hackathon_reviewer.utils.process_pool import process_pool
 
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules", ".git", "vendor", "venv", ".venv", "__pycache__",
     ".next", "dist", "build", ".cache", "target", "coverage",
     ".idea", ".vscode", "env", ".env", ".tox", "egg-info",
     ".mypy_cache", ".pytest_cache", ".ruff_cache",
-}
+})
 
-SOURCE_EXTENSIONS = {
+SOURCE_EXTENSIONS = frozenset({
     ".py", ".js", ".ts", ".tsx", ".jsx", ".rs", ".go", ".java",
     ".rb", ".swift", ".kt", ".cpp", ".c", ".cs", ".vue", ".svelte",
     ".dart", ".sh", ".bash", ".zsh",
-}
+})
 
-SCANNABLE_EXTENSIONS = SOURCE_EXTENSIONS | {
+SCANNABLE_EXTENSIONS = SOURCE_EXTENSIONS | frozenset({
     ".md", ".txt", ".json", ".yaml", ".yml", ".toml",
     ".cfg", ".ini", ".conf",
-}
+})
 
-SCANNABLE_FILENAMES = {
+SCANNABLE_FILENAMES = frozenset({
     ".env.example", "Dockerfile", "docker-compose.yml", "Makefile",
     "Procfile", "CLAUDE.md",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Pattern bundles — granular, mix-and-match groups of related regex patterns.
@@ -361,6 +365,13 @@ def get_patterns(cfg: ReviewConfig) -> dict[str, dict]:
 
     patterns = _flatten_bundles(bundle_ids)
     for name, pat_cfg in (sa.extra_patterns or {}).items():
+        for regex in pat_cfg.get("patterns", []):
+            try:
+                re.compile(regex)
+            except re.error as e:
+                raise ValueError(
+                    f"static_analysis.extra_patterns[{name!r}]: invalid regex {regex!r}: {e}"
+                ) from e
         patterns[name] = pat_cfg
     return patterns
 
@@ -379,55 +390,317 @@ BOILERPLATE_INDICATORS = {
     },
 }
 
+# Config file -> {lowercase keyword: framework}, matched against the file's
+# lowercased bytes. A config file with no keyword hit falls back to its
+# language in FRAMEWORK_LANGUAGES.
+FRAMEWORK_SIGNALS: dict[str, dict[bytes, str]] = {
+    "package.json": {b"next": "Next.js", b"react": "React", b"vue": "Vue",
+                     b"express": "Express", b"svelte": "Svelte"},
+    "requirements.txt": {b"flask": "Flask", b"fastapi": "FastAPI",
+                         b"django": "Django", b"streamlit": "Streamlit"},
+    "pyproject.toml": {b"flask": "Flask", b"fastapi": "FastAPI", b"django": "Django"},
+    "Cargo.toml": {},
+    "go.mod": {},
+}
+
+FRAMEWORK_LANGUAGES = {
+    "Cargo.toml": "Rust", "go.mod": "Go",
+    "package.json": "Node.js",
+    "requirements.txt": "Python", "pyproject.toml": "Python",
+}
+
 
 # ---------------------------------------------------------------------------
 # Scanning
 # ---------------------------------------------------------------------------
 
-def _scan_file(filepath: Path) -> str:
+# Small files (package.json, requirements.txt, ...) are read by both the
+# pattern scan and the structure checks; keep their contents keyed on
+# mtime and size so an edited file is never served stale.
+SCAN_CACHE_MAX_BYTES = 64 * 1024
+
+
+def _read_file(filepath: str | Path) -> bytes:
     try:
-        with open(filepath, "r", encoding="utf-8", errors="ignore") as f:
+        with open(filepath, "rb") as f:
             return f.read()
     except OSError:
-        return ""
+        return b""
+
+
+@lru_cache(maxsize=256)
+def _scan_file_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    return _read_file(path)
+
+
+def _scan_file(filepath: str | Path) -> bytes:
+    """Raw file bytes. Patterns are matched as bytes, so nothing is decoded."""
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return b""
+    if st.st_size > SCAN_CACHE_MAX_BYTES:
+        return _read_file(filepath)
+    return _scan_file_cached(os.fspath(filepath), st.st_mtime_ns, st.st_size)
+
+
+# Generated files (bundles, lockfiles, source maps) can be megabytes of one
+# line and never say anything about how a team used the models.
+MAX_SCAN_BYTES = 1024 * 1024
+GENERATED_FILE_SUFFIXES = (".min.js", ".min.css", ".map", "-lock.json", "-lock.yaml")
+
+
+def _walk_repo(repo_dir: Path) -> tuple[list[tuple[str, str]], set[str]]:
+    """One scandir pass over a repo, pruning SKIP_DIRS like the old os.walk.
+
+    Returns `(rel_path, path)` for every file worth pattern-scanning, in
+    os.walk order, plus the relative path of every entry seen so the
+    boilerplate and structure checks can test membership instead of
+    stat-ing each candidate. Symlinked dirs are listed but not followed.
+    """
+    scan: list[tuple[str, str]] = []
+    seen: set[str] = set()
+
+    def visit(path: str, prefix: str) -> None:
+        try:
+            with os.scandir(path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            seen.add(prefix + name)
+            try:
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                if name not in SKIP_DIRS and not entry.is_symlink():
+                    subdirs.append(entry)
+                continue
+            ext = os.path.splitext(name)[1].lower()
+            if ext not in SCANNABLE_EXTENSIONS and name not in SCANNABLE_FILENAMES:
+                continue
+            if name.lower().endswith(GENERATED_FILE_SUFFIXES):
+                continue
+            try:
+                if entry.stat().st_size > MAX_SCAN_BYTES:
+                    continue
+            except OSError:
+                continue
+            scan.append((prefix + name, entry.path))
+        for entry in subdirs:
+            visit(entry.path, prefix + entry.name + os.sep)
+
+    visit(str(repo_dir), "")
+    return scan, seen
+
+
+RG_TIMEOUT = 600
+
+
+def _rg_matching_files(repo_dirs: list[Path], active_patterns: dict[str, dict]) -> set[str] | None:
+    """One ripgrep pass over every repo: the set of files matching any pattern.
+
+    Used as a prefilter so the Python scan only opens files that can
+    contribute a match. Returns None (scan everything) when ripgrep isn't
+    installed or rejects a pattern, e.g. Python-only syntax in
+    `extra_patterns`, so results never depend on ripgrep being present.
+
+    The Python scan searches whole file contents and reads through symlinked
+    files, so ripgrep runs with `--multiline` (a `\\s*` may span lines) and
+    `--follow`; anything narrower would drop files the full scan matches.
+    """
+    regexes = [r for cfg in active_patterns.values() for r in cfg["patterns"]]
+    if not repo_dirs or not regexes:
+        return None
+    cmd = ["rg", "--files-with-matches", "--ignore-case", "--no-messages",
+           "--no-ignore", "--hidden", "--text", "--multiline", "--follow"]
+    for d in SKIP_DIRS:
+        cmd += ["--glob", f"!{d}/"]
+    for r in regexes:
+        cmd += ["-e", r]
+    cmd += [str(d) for d in repo_dirs]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=RG_TIMEOUT)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    # rc 1 = no matches at all; rc 2 = error (bad pattern, unreadable file).
+    if proc.returncode not in (0, 1):
+        return None
+    return {os.path.normpath(line) for line in proc.stdout.splitlines() if line}
+
+
+_OCTAL_DIGITS = "01234567"
+
+
+def _escape_end(regex: str, i: int) -> int:
+    """Index just past the alphanumeric escape whose backslash is at `regex[i]`.
+
+    Consumes the escape's whole argument, following sre_parse: `\\xHH`,
+    `\\uHHHH`, `\\UHHHHHHHH`, `\\N{name}`, octal `\\0oo` and `\\ooo`,
+    and one- or two-digit group references.
+    """
+    n = len(regex)
+    e = regex[i + 1]
+    j = i + 2
+    if e in "xuU":
+        return min(j + {"x": 2, "u": 4, "U": 8}[e], n)
+    if e == "N":
+        close = regex.find("}", j)
+        return close + 1 if close != -1 else n
+    if e == "0":
+        while j < min(i + 4, n) and regex[j] in _OCTAL_DIGITS:
+            j += 1
+        return j
+    if e.isdigit():
+        octal = regex[j:j + 2]
+        if e in _OCTAL_DIGITS and len(octal) == 2 and all(d in _OCTAL_DIGITS for d in octal):
+            return j + 2
+        if j < n and regex[j].isdigit():
+            return j + 1
+    return j
+
+
+def _required_literals(regex: str) -> tuple[tuple[str, ...], bool]:
+    """Literal runs every match of `regex` must contain, lowercased, longest first.
+
+    Returns (literals, is_pure): `is_pure` means the whole pattern is one
+    literal, so counting occurrences gives the findall count. Only plain
+    top-level characters count; anything inside groups or classes, escapes
+    like `\\s` or `\\x41` (consumed whole, argument included), and
+    characters made optional by a quantifier end the run.
+    Top-level alternation, verbose mode, and non-ASCII runs give ((), False).
+    """
+    if re.compile(regex).flags & re.VERBOSE:
+        return (), False
+    runs: list[str] = []
+    cur: list[str] = []
+    pure = True
+    depth = 0
+    i, n = 0, len(regex)
+    while i < n:
+        c = regex[i]
+        lit = None
+        if c == "\\" and i + 1 < n:
+            if regex[i + 1].isalnum():
+                i = _escape_end(regex, i)
+            else:
+                lit = regex[i + 1]
+                i += 2
+        elif c == "[":
+            i += 1
+            if i < n and regex[i] == "^":
+                i += 1
+            if i < n and regex[i] == "]":
+                i += 1
+            while i < n and regex[i] != "]":
+                i += 2 if regex[i] == "\\" else 1
+            i += 1
+        elif c == "{":
+            if cur:
+                cur.pop()
+            i = regex.find("}", i) + 1 or n
+        elif c in "*?+":
+            if cur:
+                cur.pop()
+            i += 1
+        else:
+            if c == "(":
+                depth += 1
+            elif c == ")":
+                depth -= 1
+            elif c == "|" and depth == 0:
+                return (), False
+            elif c not in ".^$":
+                lit = c
+            i += 1
+        if lit is not None and depth == 0:
+            cur.append(lit)
+            continue
+        pure = False
+        if cur:
+            runs.append("".join(cur))
+            cur = []
+    if cur:
+        runs.append("".join(cur))
+    if not all(run.isascii() for run in runs):
+        return (), False
+    runs.sort(key=len, reverse=True)
+    return tuple(run.lower() for run in runs), pure and len(runs) == 1
+
+
+@lru_cache(maxsize=None)
+def _compile_category(regexes: tuple[str, ...]) -> tuple[tuple[re.Pattern, tuple[bytes, ...], bool], ...]:
+    """Compile one category's regexes, with their literal prefilters.
+
+    Runs once per pattern set. ASCII patterns compile as bytes: both bytes
+    IGNORECASE matching and bytes.lower() fold ASCII only, so the prefilter
+    agrees with the regex. Non-ASCII patterns, and str-only syntax such as
+    `(?u)` or `\\N{...}`, stay str patterns matched against the decoded
+    text with Unicode case folding and no prefilter.
+    """
+    compiled = []
+    for r in regexes:
+        if r.isascii():
+            try:
+                regex = re.compile(r.encode(), re.IGNORECASE)
+            except re.error:
+                pass
+            else:
+                literals, is_pure = _required_literals(r)
+                compiled.append((regex, tuple(lit.encode() for lit in literals), is_pure))
+                continue
+        compiled.append((re.compile(r, re.IGNORECASE), (), False))
+    return tuple(compiled)
 
 
 def _detect_ai_integration(
-    repo_dir: Path,
+    files: list[tuple[str, str]],
     active_patterns: dict[str, dict],
+    candidate_files: set[str] | None = None,
 ) -> tuple[dict[str, PatternMatch], int, IntegrationDepth]:
     patterns_found: dict[str, PatternMatch] = {}
     total_matches = 0
 
-    if not repo_dir.exists():
-        return patterns_found, 0, IntegrationDepth.NONE
+    categories = [
+        (name, config, _compile_category(tuple(config["patterns"])))
+        for name, config in active_patterns.items()
+    ]
 
-    for root, dirs, files in os.walk(repo_dir):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for fname in files:
-            fpath = Path(root) / fname
-            ext = fpath.suffix.lower()
-            if ext not in SCANNABLE_EXTENSIONS and fname not in SCANNABLE_FILENAMES:
-                continue
+    for rel_path, fpath in files:
+        if candidate_files is not None and os.path.normpath(fpath) not in candidate_files:
+            continue
 
-            content = _scan_file(fpath)
-            if not content:
-                continue
+        content = _scan_file(fpath)
+        if not content:
+            continue
 
-            rel_path = str(fpath.relative_to(repo_dir))
-
-            for pattern_name, config in active_patterns.items():
-                for regex in config["patterns"]:
-                    matches = re.findall(regex, content, re.IGNORECASE)
-                    if matches:
-                        if pattern_name not in patterns_found:
-                            patterns_found[pattern_name] = PatternMatch(
-                                description=config["description"],
-                            )
-                        patterns_found[pattern_name].files.append(rel_path)
-                        patterns_found[pattern_name].match_count += len(matches)
-                        total_matches += len(matches)
-                        break
+        lowered = content.lower()
+        text: str | None = None
+
+        for pattern_name, config, compiled in categories:
+            for regex, literals, is_pure in compiled:
+                if not all(lit in lowered for lit in literals):
+                    continue
+                if is_pure:
+                    count = lowered.count(literals[0])
+                elif isinstance(regex.pattern, str):
+                    if text is None:
+                        text = content.decode("utf-8", errors="ignore")
+                    count = len(regex.findall(text))
+                else:
+                    count = len(regex.findall(content))
+                if count:
+                    if pattern_name not in patterns_found:
+                        patterns_found[pattern_name] = PatternMatch(
+                            description=config["description"],
+                        )
+                    patterns_found[pattern_name].files.append(rel_path)
+                    patterns_found[pattern_name].match_count += count
+                    total_matches += count
+                    break
 
     score = 0
     for pname, pdata in patterns_found.items():
@@ -449,12 +722,16 @@ def _detect_ai_integration(
     return patterns_found, score, depth
 
 
-def _detect_boilerplate(repo_dir: Path, total_loc: int) -> tuple[str | None, bool]:
-    if not repo_dir.exists():
-        return None, False
+# Indicator files as native relative paths, matching `_walk_repo`'s keys.
+_BOILERPLATE_FILE_SETS = {
+    bp_name: frozenset(os.path.normpath(f) for f in config["files"])
+    for bp_name, config in BOILERPLATE_INDICATORS.items()
+}
+
 
+def _detect_boilerplate(paths: set[str], total_loc: int) -> tuple[str | None, bool]:
     for bp_name, config in BOILERPLATE_INDICATORS.items():
-        matched = sum(1 for f in config["files"] if (repo_dir / f).exists())
+        matched = len(_BOILERPLATE_FILE_SETS[bp_name] & paths)
         if matched >= len(config["files"]) * 0.6:
             is_heavy = total_loc < 500
             return config["description"], is_heavy
@@ -462,59 +739,46 @@ def _detect_boilerplate(repo_dir: Path, total_loc: int) -> tuple[str | None, boo
     return None, False
 
 
-def _analyze_structure(repo_dir: Path) -> RepoStructure:
+def _analyze_structure(repo_dir: Path, paths: set[str]) -> RepoStructure:
     structure = RepoStructure()
-    if not repo_dir.exists():
+    # DirEntry answers is_dir/is_file from the directory listing itself,
+    # so only symlinks cost a stat here.
+    try:
+        with os.scandir(repo_dir) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
         return structure
 
-    for item in sorted(repo_dir.iterdir()):
-        if item.name.startswith(".") and item.name not in {".env.example", ".claude"}:
+    for entry in entries:
+        if entry.name.startswith(".") and entry.name not in {".env.example", ".claude"}:
             continue
-        if item.is_dir() and item.name not in SKIP_DIRS:
-            structure.top_level_dirs.append(item.name)
-        elif item.is_file():
-            structure.top_level_files.append(item.name)
+        if entry.is_dir() and entry.name not in SKIP_DIRS:
+            structure.top_level_dirs.append(entry.name)
+        elif entry.is_file():
+            structure.top_level_files.append(entry.name)
 
     structure.has_docker = any(
-        (repo_dir / f).exists()
-        for f in ["Dockerfile", "docker-compose.yml", "docker-compose.yaml"]
+        f in paths for f in ["Dockerfile", "docker-compose.yml", "docker-compose.yaml"]
     )
-    structure.has_ci = (repo_dir / ".github" / "workflows").exists()
+    structure.has_ci = os.path.join(".github", "workflows") in paths
     structure.has_env_example = any(
-        (repo_dir / f).exists()
-        for f in [".env.example", ".env.local.example", ".env.sample"]
+        f in paths for f in [".env.example", ".env.local.example", ".env.sample"]
     )
-    structure.has_claude_md = (repo_dir / "CLAUDE.md").exists() or (repo_dir / ".claude").exists()
+    structure.has_claude_md = "CLAUDE.md" in paths or ".claude" in paths
     structure.has_license = any(
-        (repo_dir / f).exists() for f in ["LICENSE", "LICENSE.md", "LICENSE.txt"]
+        f in paths for f in ["LICENSE", "LICENSE.md", "LICENSE.txt"]
     )
 
-    framework_signals = {
-        "package.json": {"next": "Next.js", "react": "React", "vue": "Vue",
-                         "express": "Express", "svelte": "Svelte"},
-        "requirements.txt": {"flask": "Flask", "fastapi": "FastAPI",
-                             "django": "Django", "streamlit": "Streamlit"},
-        "pyproject.toml": {"flask": "Flask", "fastapi": "FastAPI", "django": "Django"},
-        "Cargo.toml": {},
-        "go.mod": {},
-    }
-
-    for config_file, detectors in framework_signals.items():
-        if (repo_dir / config_file).exists():
+    for config_file, detectors in FRAMEWORK_SIGNALS.items():
+        if config_file in paths:
             content = _scan_file(repo_dir / config_file).lower()
             detected = False
             for keyword, framework in detectors.items():
                 if keyword in content:
                     structure.frameworks_detected.append(framework)
                     detected = True
-            if not detected:
-                lang_map = {
-                    "Cargo.toml": "Rust", "go.mod": "Go",
-                    "package.json": "Node.js",
-                    "requirements.txt": "Python", "pyproject.toml": "Python",
-                }
-                if config_file in lang_map:
-                    structure.frameworks_detected.append(lang_map[config_file])
+            if not detected and config_file in FRAMEWORK_LANGUAGES:
+                structure.frameworks_detected.append(FRAMEWORK_LANGUAGES[config_file])
 
     structure.frameworks_detected = list(set(structure.frameworks_detected))
     return structure
@@ -529,6 +793,7 @@ def _process_one(
     meta: RepoMetadata,
     cfg: ReviewConfig,
     active_patterns: dict[str, dict],
+    candidate_files: set[str] | None = None,
 ) -> StaticAnalysisResult:
     result = StaticAnalysisResult(
         team_number=sub.team_number,
@@ -541,16 +806,18 @@ def _process_one(
     from hackathon_reviewer.utils.cache_key import resolve_repo_dir
     repo_dir = resolve_repo_dir(cfg.repos_dir, sub)
 
-    patterns, score, depth = _detect_ai_integration(repo_dir, active_patterns)
+    files, paths = _walk_repo(repo_dir)
+
+    patterns, score, depth = _detect_ai_integration(files, active_patterns, candidate_files)
     result.integration_patterns = patterns
     result.integration_score = score
     result.integration_depth = depth
 
-    bp_type, is_heavy = _detect_boilerplate(repo_dir, meta.files.total_loc)
+    bp_type, is_heavy = _detect_boilerplate(paths, meta.files.total_loc)
     result.boilerplate_type = bp_type
     result.is_boilerplate_heavy = is_heavy
 
-    result.structure = _analyze_structure(repo_dir)
+    result.structure = _analyze_structure(repo_dir, paths)
 
     return result
 
@@ -572,16 +839,52 @@ def run_static_analysis(
 
     meta_by_team = {m.team_number: m for m in repo_metadata}
     total = len(submissions)
-    results: list[StaticAnalysisResult] = []
 
-    for i, sub in enumerate(tqdm(submissions, desc="Static analysis"), 1):
-        meta = meta_by_team.get(sub.team_number, RepoMetadata(
-            team_number=sub.team_number, team_name=sub.team_name,
-            project_name=sub.project_name, sanitized_name=sub.sanitized_name,
-        ))
-        results.append(_process_one(sub, meta, cfg, active_patterns))
-        if progress:
-            progress.update(i, total, sub.project_name)
+    from hackathon_reviewer.utils.cache_key import resolve_repo_dir
+    repo_dirs = [
+        d for d in (
+            resolve_repo_dir(cfg.repos_dir, sub) for sub in submissions
+            if sub.team_number in meta_by_team and meta_by_team[sub.team_number].clone_success
+        )
+        if d.exists()
+    ]
+    candidate_files = _rg_matching_files(repo_dirs, active_patterns)
+    if candidate_files is not None:
+        click.echo(f"  ripgrep prefilter: {len(candidate_files)} candidate files")
+
+    # Each worker only needs its own repo's candidates, not the whole set.
+    candidates_by_repo: dict[str, set[str]] = {}
+    if candidate_files is not None:
+        root = os.path.join(os.path.normpath(cfg.repos_dir), "")
+        for path in candidate_files:
+            if path.startswith(root):
+                name = path[len(root):].split(os.sep, 1)[0]
+                candidates_by_repo.setdefault(os.path.join(root, name), set()).add(path)
+
+    # Scanning is CPU-bound Python and each repo is independent, so
+    # submissions fan out across a process pool. This runs on the repo
+    # branch's thread while the video branch is busy, hence no fork.
+    by_team: dict[int, StaticAnalysisResult] = {}
+    workers = cfg.concurrency.static_analysis_workers or None
+    with process_pool(workers) as pool:
+        futures = {}
+        for sub in submissions:
+            meta = meta_by_team.get(sub.team_number, RepoMetadata(
+                team_number=sub.team_number, team_name=sub.team_name,
+                project_name=sub.project_name, sanitized_name=sub.sanitized_name,
+            ))
+            repo_candidates = None
+            if candidate_files is not None:
+                repo_dir = os.path.normpath(resolve_repo_dir(cfg.repos_dir, sub))
+                repo_candidates = candidates_by_repo.get(repo_dir, set())
+            futures[pool.submit(_process_one, sub, meta, cfg, active_patterns, repo_candidates)] = sub
+        for i, future in enumerate(tqdm(as_completed(futures), total=total, desc="Static analysis"), 1):
+            sub = futures[future]
+            by_team[sub.team_number] = future.result()
+            if progress:
+                progress.update(i, total, sub.project_name)
+
+    results = [by_team[sub.team_number] for sub in submissions]
 
     depths = {}
     for r in results:
@@ -593,8 +896,7 @@ def run_static_analysis(
             click.echo(f"    {d}: {depths[d]}")
 
     out_path = cfg.data_dir / "static_analysis.json"
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump([r.model_dump(mode="json") for r in results], f, indent=2, ensure_ascii=False)
+    dump_model_list(out_path, results, StaticAnalysisResult)
     click.echo(f"  Saved to {out_path}")
 
     return results
@@ -605,5 +907,4 @@ def load_static_analysis(cfg: ReviewConfig) -> list[StaticAnalysisResult]:
     path = cfg.data_dir / "static_analysis.json"
     if not path.exists():
         raise FileNotFoundError(f"{path} not found. Run the analyze stage first.")
-    with open(path) as f:
-        return [StaticAnalysisResult(**r) for r in json.load(f)]
+    return load_model_list(path, StaticAnalysisResult)
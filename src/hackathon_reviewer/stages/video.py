@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import json
+from collections.abc import Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
@@ -15,6 +15,7 @@ from hackathon_reviewer.models import (
     VideoDownloadResult,
     VideoPlatform,
 )
+from hackathon_reviewer.utils.json_io import dump_team_map, load_team_map
 from hackathon_reviewer.utils.video_download import (
     download_gdown,
     download_ytdlp,
@@ -26,10 +27,30 @@ MAX_DOWNLOAD_RETRIES = 2
 RETRY_DELAY = 3
 
 
+def _probe_duration(
+    video_path: Path, result: VideoDownloadResult, previous: VideoDownloadResult | None
+) -> None:
+    """Fill in size and duration, reusing the last run's ffprobe if the file is unchanged."""
+    result.file_size = video_path.stat().st_size
+    if (
+        previous is not None
+        and previous.file_path == str(video_path)
+        and previous.file_size == result.file_size
+        and previous.duration_seconds > 0
+    ):
+        result.duration_seconds = previous.duration_seconds
+    else:
+        result.duration_seconds = round(get_video_duration(video_path), 1)
+
+
 def _download_one(
-    sub: Submission, cfg: ReviewConfig
+    sub: Submission, cfg: ReviewConfig, previous: VideoDownloadResult | None = None
 ) -> tuple[int, VideoDownloadResult]:
-    """Download a single video with auto-retry. Returns (team_number, result)."""
+    """Download a single video with auto-retry. Returns (team_number, result).
+
+    `previous` is this team's entry from the last saved run, if any; a cached
+    file that hasn't changed size keeps its recorded duration.
+    """
     import time
     from hackathon_reviewer.utils.cache_key import video_cache_key
 
@@ -48,7 +69,7 @@ def _download_one(
         result.success = True
         result.method = "cached"
         result.file_path = str(video_path)
-        result.duration_seconds = round(get_video_duration(video_path), 1)
+        _probe_duration(video_path, result, previous)
         return sub.team_number, result
 
     # One-time migration from sanitized_name path to URL-hash path
@@ -69,7 +90,7 @@ def _download_one(
             result.success = True
             result.method = "cached"
             result.file_path = str(video_path)
-            result.duration_seconds = round(get_video_duration(video_path), 1)
+            _probe_duration(video_path, result, previous)
             return sub.team_number, result
         except OSError:
             pass  # fall through to fresh download
@@ -97,7 +118,7 @@ def _download_one(
             result.error = None
             if video_path.exists():
                 result.file_path = str(video_path)
-                result.duration_seconds = round(get_video_duration(video_path), 1)
+                _probe_duration(video_path, result, None)
             return sub.team_number, result
 
         last_error = error
@@ -117,17 +138,24 @@ def run_video_download(
     submissions: list[Submission],
     resume: bool = True,
     progress: "Any | None" = None,
+    on_result: Callable[[int, VideoDownloadResult], None] | None = None,
 ) -> dict[int, VideoDownloadResult]:
-    """Download all demo videos in parallel, save results to JSON."""
+    """Download all demo videos in parallel, save results to JSON.
+
+    `on_result(team_number, result)` is called as each result is known
+    (resumed ones first), so a downstream stage can start on it right away.
+    """
     click.echo("\n--- Stage 3: Download Videos ---")
     workers = cfg.concurrency.video_download_workers
     click.echo(f"  Workers: {workers}")
 
     existing: dict[int, VideoDownloadResult] = {}
     out_path = cfg.data_dir / "video_downloads.json"
-    if resume and out_path.exists():
+    if out_path.exists():
+        # Loaded even without resume: cached videos reuse recorded durations.
         existing = _load_downloads_file(out_path)
-        click.echo(f"  Resuming: {len(existing)} already processed")
+        if resume:
+            click.echo(f"  Resuming: {len(existing)} already processed")
 
     sub_by_team = {s.team_number: s for s in submissions}
     results: dict[int, VideoDownloadResult] = {}
@@ -136,21 +164,40 @@ def run_video_download(
     for sub in submissions:
         if resume and sub.team_number in existing and existing[sub.team_number].success:
             results[sub.team_number] = existing[sub.team_number]
+            if on_result:
+                on_result(sub.team_number, results[sub.team_number])
         else:
             work.append(sub)
 
     total = len(submissions)
     done = total - len(work)
 
+    # Start the longest jobs first so one slow download picked up last
+    # doesn't leave the other workers idle. A duration from an earlier run
+    # is the best guess; otherwise Drive (gdown, then yt-dlp) goes ahead.
+    # A video still on disk from an earlier run returns at once, so it costs
+    # nothing whatever its length and goes last.
+    def _expected_cost(sub: Submission) -> tuple[bool, float, bool]:
+        prev = existing.get(sub.team_number)
+        cached = bool(prev and prev.success and prev.file_path and Path(prev.file_path).exists())
+        return (
+            cached,
+            -(prev.duration_seconds if prev and not cached else 0.0),
+            sub.video.platform != VideoPlatform.GOOGLE_DRIVE,
+        )
+
     with ThreadPoolExecutor(max_workers=workers) as pool:
         futures = {
-            pool.submit(_download_one, sub, cfg): sub.team_number for sub in work
+            pool.submit(_download_one, sub, cfg, existing.get(sub.team_number)): sub.team_number
+            for sub in sorted(work, key=_expected_cost)
         }
         for future in tqdm(
             as_completed(futures), total=len(futures), desc="Downloading videos"
         ):
             team_num, result = future.result()
             results[team_num] = result
+            if on_result:
+                on_result(team_num, result)
             done += 1
             if not result.success and progress:
                 sub = sub_by_team[team_num]
@@ -161,18 +208,14 @@ def run_video_download(
     downloaded = sum(1 for r in results.values() if r.success)
     click.echo(f"  Downloaded: {downloaded}/{len(results)}")
 
-    serializable = {str(k): v.model_dump(mode="json") for k, v in results.items()}
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump(serializable, f, indent=2, ensure_ascii=False)
+    dump_team_map(out_path, results, VideoDownloadResult)
     click.echo(f"  Saved to {out_path}")
 
     return results
 
 
 def _load_downloads_file(path: Path) -> dict[int, VideoDownloadResult]:
-    with open(path) as f:
-        raw = json.load(f)
-    return {int(k): VideoDownloadResult(**v) for k, v in raw.items()}
+    return load_team_map(path, VideoDownloadResult)
 
 
 def load_video_downloads(cfg: ReviewConfig) -> dict[int, VideoDownloadResult]:
@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
-import threading
+import queue
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
@@ -20,6 +20,9 @@ from hackathon_reviewer.models import (
     VideoDownloadResult,
 )
 from hackathon_reviewer.providers.base import VideoReviewContext, VideoScoreCriterionDef
+from hackathon_reviewer.utils.checkpoint import ListCheckpoint
+from hackathon_reviewer.utils.json_io import dump_model_list, load_model_list
+from hackathon_reviewer.utils.rate_limit import BlockingTokenBucket
 from hackathon_reviewer.utils.video_download import prepare_video_for_upload
 
 
@@ -41,6 +44,7 @@ def _build_provider(cfg: ReviewConfig):
         return GeminiProvider(
             api_key=cfg.gemini_api_key,
             model=cfg.video_analysis.model,
+            upload_registry_path=cfg.data_dir / "gemini_uploads.json",
         )
     else:
         raise ValueError(f"Unknown video analysis provider: {provider_name}. Only 'gemini' supports native video.")
@@ -51,7 +55,13 @@ def _analyze_one(
     sub: Submission,
     download: VideoDownloadResult,
     cfg: ReviewConfig,
+    limiter: BlockingTokenBucket | None = None,
 ) -> VideoAnalysisResult:
+    """Prepare and analyze one team's video.
+
+    `limiter`, when given, is shared by every worker and holds the provider
+    call until the per-minute request budget allows it.
+    """
     result = VideoAnalysisResult(
         team_number=sub.team_number,
         download=download,
@@ -70,6 +80,7 @@ def _analyze_one(
     # Trim long videos and downscale to 720p for faster upload
     prepared_path = prepare_video_for_upload(
         video_path, max_duration=cfg.video_analysis.max_video_duration,
+        workers=cfg.concurrency.video_prep_workers,
     )
 
     video_score_defs = []
@@ -88,6 +99,8 @@ def _analyze_one(
         score_criteria=video_score_defs,
     )
 
+    if limiter is not None:
+        limiter.acquire()
     resp = provider.review_video(ctx)
 
     result.analysis_success = resp.success
@@ -111,9 +124,6 @@ def _analyze_one(
 # Stage entry points
 # ---------------------------------------------------------------------------
 
-_save_lock = threading.Lock()
-
-
 def _video_analysis_config_sig(cfg: ReviewConfig) -> str:
     from hackathon_reviewer.utils.llm_cache import stable_hash
     return stable_hash({
@@ -139,11 +149,20 @@ def _video_analysis_input_sig(
 def run_video_analysis(
     cfg: ReviewConfig,
     submissions: list[Submission],
-    video_downloads: dict[int, VideoDownloadResult],
+    video_downloads: dict[int, VideoDownloadResult] | Iterable[tuple[int, VideoDownloadResult]],
     resume: bool = True,
     progress: "Any | None" = None,
 ) -> list[VideoAnalysisResult]:
-    """Run Gemini video analysis on all downloaded videos in parallel."""
+    """Run Gemini video analysis on all downloaded videos in parallel.
+
+    `video_downloads` is either the finished download map or an iterable of
+    `(team_number, download)` pairs that yields as downloads land, so the
+    full pipeline can analyze early videos while later ones still download.
+    Submissions the iterable never yields are analyzed (and fail) without a
+    video once it is exhausted. If iterating it raises (the download stage
+    crashed), queued analyses are cancelled and the error propagates
+    without writing the final results file.
+    """
     from hackathon_reviewer.utils.llm_cache import LLMCache
 
     click.echo("\n--- Stage 6: Video Analysis ---")
@@ -154,10 +173,12 @@ def run_video_analysis(
 
     provider = _build_provider(cfg)
 
-    existing: dict[int, VideoAnalysisResult] = {}
+    # Successful results from a previous run; failures are retried.
+    done: dict[int, VideoAnalysisResult] = {}
     out_path = cfg.data_dir / "video_analysis.json"
     if resume and out_path.exists():
-        existing = {r.team_number: r for r in _load_analysis_file(out_path)}
+        existing = _load_analysis_file(out_path)
+        done = {r.team_number: r for r in existing if r.analysis_success}
         click.echo(f"  Resuming: {len(existing)} already analyzed")
 
     cache = LLMCache(cfg.cache_dir, "video_analysis")
@@ -165,64 +186,134 @@ def run_video_analysis(
     cache_hits = 0
 
     results_map: dict[int, VideoAnalysisResult] = {}
-    work: list[Submission] = []
-
+    pending: dict[int, Submission] = {}
     for sub in submissions:
-        if resume and sub.team_number in existing and existing[sub.team_number].analysis_success:
-            results_map[sub.team_number] = existing[sub.team_number]
-            continue
-
-        # Try the hackathon-level cache before scheduling the LLM call.
-        if cache.enabled:
-            download = video_downloads.get(sub.team_number)
-            input_sig = _video_analysis_input_sig(sub, download) if download else None
-            if input_sig:
-                cached = cache.load(sub.team_number, config_sig, input_sig)
-                if cached is not None:
-                    try:
-                        results_map[sub.team_number] = VideoAnalysisResult(**cached)
-                        cache_hits += 1
-                        continue
-                    except Exception:
-                        pass
-
-        work.append(sub)
-
-    if cache_hits:
-        click.echo(f"  Cache hits: {cache_hits} (skipping LLM)")
+        previous = done.get(sub.team_number)
+        if previous is not None:
+            results_map[sub.team_number] = previous
+        else:
+            pending[sub.team_number] = sub
+
+    if isinstance(video_downloads, dict):
+        arrivals = [(s.team_number, video_downloads[s.team_number])
+                    for s in submissions if s.team_number in video_downloads]
+    else:
+        arrivals = video_downloads
+    downloads: dict[int, VideoDownloadResult] = {}
+
+    def _cached_result(sub: Submission, download: VideoDownloadResult) -> VideoAnalysisResult | None:
+        """Try the hackathon-level cache before scheduling the LLM call."""
+        if not cache.enabled:
+            return None
+        input_sig = _video_analysis_input_sig(sub, download)
+        if not input_sig:
+            return None
+        cached = cache.load(sub.team_number, config_sig, input_sig)
+        if cached is None:
+            return None
+        try:
+            return VideoAnalysisResult(**cached)
+        except Exception:
+            return None
 
     start = time.time()
     completed = 0
 
-    def _do_one(sub: Submission) -> tuple[int, VideoAnalysisResult]:
-        download = video_downloads.get(sub.team_number, VideoDownloadResult())
-        return sub.team_number, _analyze_one(provider, sub, download, cfg)
+    rpm = cfg.concurrency.video_requests_per_minute
+    limiter = BlockingTokenBucket(rpm) if rpm > 0 else None
+
+    def _do_one(sub: Submission, download: VideoDownloadResult) -> tuple[int, VideoAnalysisResult]:
+        return sub.team_number, _analyze_one(provider, sub, download, cfg, limiter)
+
+    # The feeder thread turns arrivals into cache hits or pool jobs; this
+    # thread retires everything from one queue, so results, checkpoints and
+    # progress only ever change here.
+    events: queue.Queue = queue.Queue()
+
+    def _feed(pool: ThreadPoolExecutor) -> None:
+        scheduled = 0
+
+        def _schedule(sub: Submission, download: VideoDownloadResult) -> None:
+            nonlocal scheduled
+            future = pool.submit(_do_one, sub, download)
+            future.add_done_callback(lambda f: events.put(("done", f)))
+            scheduled += 1
+
+        try:
+            for team_num, download in arrivals:
+                downloads[team_num] = download
+                sub = pending.pop(team_num, None)
+                if sub is None:
+                    continue
+                cached = _cached_result(sub, download)
+                if cached is not None:
+                    events.put(("cached", cached))
+                else:
+                    _schedule(sub, download)
+            for sub in list(pending.values()):
+                _schedule(sub, VideoDownloadResult())
+            pending.clear()
+        except BaseException as e:
+            events.put(("failed", e))
+            return
+        events.put(("fed", scheduled))
 
     total_submissions = len(submissions)
-    skipped = total_submissions - len(work)
-
-    with ThreadPoolExecutor(max_workers=workers) as pool:
-        futures = {pool.submit(_do_one, sub): sub.team_number for sub in work}
-        for future in tqdm(as_completed(futures), total=len(futures), desc="Video analysis"):
-            team_num, result = future.result()
-            results_map[team_num] = result
-            completed += 1
-            if result.analysis_success and cache.enabled:
-                sub = next((s for s in work if s.team_number == team_num), None)
-                download = video_downloads.get(team_num)
-                if sub and download:
-                    input_sig = _video_analysis_input_sig(sub, download)
-                    if input_sig:
-                        cache.save(team_num, config_sig, input_sig, result.model_dump(mode="json"))
-            if not result.analysis_success and progress:
-                sub = next((s for s in work if s.team_number == team_num), None)
-                if sub:
-                    progress.add_failure(team_num, sub.team_name, sub.project_name, result.analysis_error or "unknown")
-            if progress:
-                progress.update(skipped + completed, total_submissions, "")
-            if completed % 10 == 0:
-                with _save_lock:
-                    _save_analysis_map(results_map, submissions, out_path)
+    resumed = len(results_map)
+    work_by_team = dict(pending)
+
+    checkpoint = ListCheckpoint(submissions, out_path)
+    for team_num, result in results_map.items():
+        checkpoint.set(team_num, result)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool, \
+                ThreadPoolExecutor(max_workers=1, thread_name_prefix="video-feed") as feeder, \
+                tqdm(total=len(work_by_team), desc="Video analysis") as bar:
+            fed = feeder.submit(_feed, pool)
+            scheduled: int | None = None
+            while scheduled is None or completed < scheduled:
+                kind, payload = events.get()
+                if kind == "failed":
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise payload
+                if kind == "fed":
+                    scheduled = payload
+                    bar.total = scheduled
+                    bar.refresh()
+                    continue
+                if kind == "cached":
+                    results_map[payload.team_number] = payload
+                    checkpoint.set(payload.team_number, payload)
+                    cache_hits += 1
+                    continue
+
+                team_num, result = payload.result()
+                results_map[team_num] = result
+                checkpoint.set(team_num, result)
+                completed += 1
+                bar.update(1)
+                if result.analysis_success and cache.enabled:
+                    sub = work_by_team.get(team_num)
+                    download = downloads.get(team_num)
+                    if sub and download:
+                        input_sig = _video_analysis_input_sig(sub, download)
+                        if input_sig:
+                            cache.save(team_num, config_sig, input_sig, result.model_dump(mode="json"))
+                if not result.analysis_success and progress:
+                    sub = work_by_team.get(team_num)
+                    if sub:
+                        progress.add_failure(team_num, sub.team_name, sub.project_name, result.analysis_error or "unknown")
+                if progress:
+                    progress.update(resumed + cache_hits + completed, total_submissions, "")
+                if completed % 10 == 0:
+                    checkpoint.save()
+            fed.result()
+    finally:
+        checkpoint.close()
+
+    if cache_hits:
+        click.echo(f"  Cache hits: {cache_hits} (skipping LLM)")
 
     # Preserve submission order in output
     results = [results_map.get(sub.team_number, VideoAnalysisResult(team_number=sub.team_number))
@@ -243,18 +334,11 @@ def run_video_analysis(
 
 
 def _save_analysis(results: list[VideoAnalysisResult], path: Path) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump([r.model_dump(mode="json") for r in results], f, indent=2, ensure_ascii=False)
-
-
-def _save_analysis_map(results_map: dict[int, VideoAnalysisResult], submissions: list[Submission], path: Path) -> None:
-    ordered = [results_map[s.team_number] for s in submissions if s.team_number in results_map]
-    _save_analysis(ordered, path)
+    dump_model_list(path, results, VideoAnalysisResult)
 
 
 def _load_analysis_file(path: Path) -> list[VideoAnalysisResult]:
-    with open(path) as f:
-        return [VideoAnalysisResult(**r) for r in json.load(f)]
+    return load_model_list(path, VideoAnalysisResult)
 
 
 def load_video_analysis(cfg: ReviewConfig) -> list[VideoAnalysisResult]:
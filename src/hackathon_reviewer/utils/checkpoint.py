@@ -0,0 +1,76 @@
+"""Background checkpoints for long-running LLM stages.
+
+Code review and video analysis save their partial results every few
+completions so an interrupted run can resume. Re-encoding every result and
+writing the file on the thread that collects results stalls that thread for
+the whole write, so the file is written on a dedicated writer thread instead.
+"""
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from hackathon_reviewer.models import Submission
+from hackathon_reviewer.utils.json_io import dump_encoded_list
+
+
+class ListCheckpoint:
+    """Periodic snapshot of a stage's results file, in submission order.
+
+    Each result is serialized once, into its submission's slot, when it is
+    recorded. A save is then a join of the filled slots plus the write, so
+    checkpointing a long run costs O(N) overall rather than re-ordering and
+    re-encoding every result each time.
+
+    The write itself happens on a background thread, so the caller retiring
+    results never waits on disk. Saves requested while a write is still
+    queued collapse into one write of the newest snapshot. Call `close()`
+    before the final save so no checkpoint lands on top of it. A write that
+    failed is re-raised from the next `save()` or from `close()`.
+    """
+
+    def __init__(self, submissions: list[Submission], path: Path):
+        self.path = path
+        self._position = {s.team_number: i for i, s in enumerate(submissions)}
+        self._slots: list[bytes | None] = [None] * len(submissions)
+        self._pending: list[bytes] | None = None
+        self._pending_lock = threading.Lock()
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="checkpoint")
+        self._error: Exception | None = None
+
+    def set(self, team_num: int, result: BaseModel) -> None:
+        i = self._position.get(team_num)
+        if i is not None:
+            self._slots[i] = result.model_dump_json().encode()
+
+    def save(self) -> None:
+        self._raise_write_error()
+        chunks = [c for c in self._slots if c is not None]
+        with self._pending_lock:
+            queued = self._pending is not None
+            self._pending = chunks
+        if not queued:
+            self._writer.submit(self._flush)
+
+    def _flush(self) -> None:
+        with self._pending_lock:
+            chunks, self._pending = self._pending, None
+        if chunks is not None:
+            try:
+                dump_encoded_list(self.path, chunks)
+            except Exception as e:
+                self._error = e
+
+    def _raise_write_error(self) -> None:
+        error, self._error = self._error, None
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Wait for any queued checkpoint write to land."""
+        self._writer.shutdown(wait=True)
+        self._raise_write_error()
@@ -2,25 +2,86 @@
 
 from __future__ import annotations
 
+import heapq
 import os
+import re
+from collections.abc import Iterator
+from itertools import chain
 from pathlib import Path
 
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     "node_modules", ".git", "vendor", "venv", ".venv", "__pycache__",
     ".next", "dist", "build", ".cache", "target", "coverage",
     ".idea", ".vscode", "env", ".env",
-}
+})
 
 PRIORITY_FILES = ["README.md", "CLAUDE.md", ".claude/settings.json"]
 
-KEY_ENTRY_POINTS = {
+KEY_ENTRY_POINTS = frozenset({
     "main.py", "app.py", "index.ts", "index.js", "server.py", "server.ts",
     "main.ts", "main.js", "run.py", "cli.py",
-}
-
-KEY_KEYWORDS = {"claude", "anthropic", "agent", "mcp", "llm", "ai"}
-
-CODE_EXTENSIONS = {".py", ".ts", ".js", ".tsx", ".jsx", ".md", ".rs", ".go"}
+})
+
+KEY_KEYWORDS = frozenset({"claude", "anthropic", "agent", "mcp", "llm", "ai"})
+
+# Searched in the lowercased name, not with re.IGNORECASE, which also folds
+# a few non-ASCII letters (dotless i) that str.lower() leaves alone.
+_KEYWORD_RE = re.compile("|".join(re.escape(kw) for kw in sorted(KEY_KEYWORDS)))
+
+CODE_EXTENSIONS = frozenset({".py", ".ts", ".js", ".tsx", ".jsx", ".md", ".rs", ".go"})
+
+# Per-file cap on characters included in the context.
+MAX_FILE_CHARS = 4000
+
+
+def _is_key_file(name: str) -> bool:
+    if name in KEY_ENTRY_POINTS:
+        return True
+    return (
+        _KEYWORD_RE.search(name.lower()) is not None
+        and os.path.splitext(name)[1] in CODE_EXTENSIONS
+    )
+
+
+def _iter_key_files(path: str, prefix: str = "") -> Iterator[str]:
+    """Relative paths of key files under `path`, lazily and in sorted order.
+
+    Each directory's entries are visited in the order their full relative
+    paths sort: a subdirectory sorts by its name plus a separator, since
+    every path under it continues that way. That matches sorting the whole
+    list afterwards, so callers can stop walking once they have enough.
+    Prunes SKIP_DIRS and doesn't follow symlinked dirs, like os.walk.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    keyed: list[tuple[str, os.DirEntry, bool]] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                keyed.append((entry.name + os.sep, entry, True))
+        elif _is_key_file(entry.name):
+            keyed.append((entry.name, entry, False))
+    keyed.sort(key=lambda k: k[0])
+    for key, entry, is_dir in keyed:
+        if is_dir:
+            yield from _iter_key_files(entry.path, prefix + key)
+        else:
+            yield prefix + key
+
+
+def _unique(sorted_paths: Iterator[str]) -> Iterator[str]:
+    last = None
+    for p in sorted_paths:
+        if p != last:
+            yield p
+            last = p
 
 
 def read_key_files(repo_dir: Path, max_chars: int = 20000) -> str:
@@ -30,19 +91,6 @@ def read_key_files(repo_dir: Path, max_chars: int = 20000) -> str:
 
     interesting_files: list[str] = []
 
-    for root, dirs, files in os.walk(repo_dir):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        for f in files:
-            fpath = Path(root) / f
-            rel = str(fpath.relative_to(repo_dir))
-
-            if any(kw in f.lower() for kw in KEY_KEYWORDS):
-                if fpath.suffix in CODE_EXTENSIONS:
-                    interesting_files.append(rel)
-
-            if f in KEY_ENTRY_POINTS:
-                interesting_files.append(rel)
-
     agents_dir = repo_dir / ".claude" / "agents"
     if agents_dir.exists():
         for f in agents_dir.glob("*.md"):
@@ -53,19 +101,26 @@ def read_key_files(repo_dir: Path, max_chars: int = 20000) -> str:
         for f in skills_dir.rglob("*.md"):
             interesting_files.append(str(f.relative_to(repo_dir)))
 
-    all_files = PRIORITY_FILES + sorted(set(interesting_files))
-    content = ""
-    for rel_path in all_files:
+    # The walk is merged in lazily, so the budget check below stops it early.
+    key_files = _unique(heapq.merge(_iter_key_files(str(repo_dir)), sorted(set(interesting_files))))
+    parts: list[str] = []
+    total = 0
+    for rel_path in chain(PRIORITY_FILES, key_files):
         fpath = repo_dir / rel_path
-        if fpath.exists() and fpath.is_file():
+        if fpath.is_file():
             try:
-                text = fpath.read_text(encoding="utf-8", errors="ignore")
-                if len(text) > 4000:
-                    text = text[:4000] + "\n... (truncated)"
-                content += f"\n### {rel_path}\n```\n{text}\n```\n"
-                if len(content) > max_chars:
+                # Read just past the cap rather than the whole file: keeps
+                # memory flat for huge generated files and minified bundles.
+                with open(fpath, encoding="utf-8", errors="ignore") as f:
+                    text = f.read(MAX_FILE_CHARS + 1)
+                if len(text) > MAX_FILE_CHARS:
+                    text = text[:MAX_FILE_CHARS] + "\n... (truncated)"
+                part = f"\n### {rel_path}\n```\n{text}\n```\n"
+                parts.append(part)
+                total += len(part)
+                if total > max_chars:
                     break
             except Exception:
                 pass
 
-    return content if content else "(no key files found)"
+    return "".join(parts) if parts else "(no key files found)"
@@ -23,6 +23,51 @@ def run_git(args: list[str], cwd: str | Path, timeout: int = 60) -> tuple[int, s
         return -1, "", str(e)
 
 
+def head_sha(path: str | Path) -> str | None:
+    """SHA of the commit HEAD resolves to, or None (unborn HEAD, not a repo).
+
+    Read in-process through libgit2 when pygit2 is installed (the `git`
+    extra), which saves a git fork per repo across a whole hackathon. Falls
+    back to `git rev-parse` without pygit2 or when libgit2 can't open the repo.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        pygit2 = None
+
+    if pygit2 is not None:
+        try:
+            repo = pygit2.Repository(str(path))
+        except Exception:
+            repo = None
+        if repo is not None:
+            try:
+                return str(repo.revparse_single("HEAD").id)
+            except Exception:
+                return None
+
+    rc, stdout, _ = run_git(["rev-parse", "--verify", "--quiet", "HEAD"], path)
+    if rc != 0:
+        return None
+    return stdout.strip() or None
+
+
 def is_valid_repo(path: Path) -> bool:
-    rc, _, _ = run_git(["status"], path)
-    return rc == 0
+    """True if `path` is the root of a clone: HEAD resolves, or the repo is empty.
+
+    The `.git` check stops a plain directory inside some enclosing repo
+    (e.g. an output dir under a checkout) from passing as a clone.
+    Resolving HEAD only reads refs, unlike `git status`, which stats the work tree.
+    A team that pushed nothing clones to an unborn HEAD with no refs at all;
+    that counts as valid so it isn't re-cloned every run, and the metadata
+    scan reports it as empty.
+    """
+    if not (Path(path) / ".git").exists():
+        return False
+    if head_sha(path) is not None:
+        return True
+    rc, _, _ = run_git(["symbolic-ref", "--quiet", "HEAD"], path)
+    if rc != 0:
+        return False
+    rc, stdout, _ = run_git(["for-each-ref", "--count=1"], path)
+    return rc == 0 and not stdout.strip()
@@ -0,0 +1,77 @@
+"""Fast JSON loading and saving for pipeline models.
+
+Stage outputs are lists (or team-number maps) of pydantic models. Parsing
+them with `json.load` and then `Model(**row)` builds every object twice —
+once as Python dicts, once as models. A `TypeAdapter` hands the raw bytes
+straight to pydantic-core, which parses and validates in one pass; saving
+goes the other way without the intermediate `model_dump` dicts.
+
+The files stay plain JSON: the web API reads them directly. Writes go to a
+sibling temp file that is then renamed over the target, so a crash during a
+checkpoint leaves the previous file intact instead of a truncated one.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from functools import lru_cache
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel, TypeAdapter
+
+M = TypeVar("M", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+@lru_cache(maxsize=None)
+def _team_map_adapter(model: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(dict[int, model])
+
+
+def load_model_list(path: Path, model: type[M]) -> list[M]:
+    """Load a JSON array of `model` records."""
+    return _list_adapter(model).validate_json(path.read_bytes())
+
+
+def load_team_map(path: Path, model: type[M]) -> dict[int, M]:
+    """Load a JSON object of `{"<team_number>": record}` into `{int: model}`."""
+    return _team_map_adapter(model).validate_json(path.read_bytes())
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` in one rename.
+
+    The temp file is fsynced first so that, after a crash or power loss, the
+    rename never exposes a file whose contents didn't reach the disk.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def dump_model_list(path: Path, records: list[M], model: type[M]) -> None:
+    """Write `records` as a JSON array (same layout `load_model_list` reads)."""
+    write_atomic(path, _list_adapter(model).dump_json(records, indent=2))
+
+
+def dump_encoded_list(path: Path, encoded: Iterable[bytes]) -> None:
+    """Write already-serialized records as a JSON array, one per line.
+
+    For checkpoints that rewrite the same file many times: callers keep each
+    record's bytes around and only serialize what changed since the last save.
+    """
+    write_atomic(path, b"[\n" + b",\n".join(encoded) + b"\n]\n")
+
+
+def dump_team_map(path: Path, records: dict[int, M], model: type[M]) -> None:
+    """Write `{team_number: record}` as a JSON object keyed by team number."""
+    write_atomic(path, _team_map_adapter(model).dump_json(records, indent=2))
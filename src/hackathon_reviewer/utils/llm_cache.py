@@ -12,13 +12,24 @@ code review, video file size+mtime for video analysis). On lookup, both
 must match — so a config edit OR a re-clone/re-download invalidates the
 cache for that team automatically.
 
-CLI mode leaves cfg.cache_dir as None and the helpers no-op.
+CLI mode leaves cfg.cache_dir as None and `LLMCache` no-ops. Video
+analysis is its only user.
+
+Code review uses `PromptCache` instead: it keys raw provider responses by a
+hash of the full rendered request, which already covers the config and the
+repo content the signatures above stand for. It lives under
+`cfg.prompt_cache_dir`, which is `cache_dir` in web mode and falls back to
+`<output_dir>/cache` in CLI mode, so CLI re-runs are cached too. Entries
+are never evicted or invalidated (a changed input just misses); delete the
+directory to reclaim space.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -32,14 +43,11 @@ def stable_hash(payload: Any) -> str:
 
 def repo_head_sha(repo_dir: Path) -> str | None:
     """Return the current git HEAD SHA for the cloned repo, or None."""
-    from hackathon_reviewer.utils.git import run_git
+    from hackathon_reviewer.utils.git import head_sha
     try:
-        rc, stdout, _ = run_git(["rev-parse", "HEAD"], str(repo_dir))
-        if rc == 0:
-            return stdout.strip() or None
+        return head_sha(repo_dir)
     except Exception:
-        pass
-    return None
+        return None
 
 
 def video_file_signature(video_path: Path | str | None) -> str | None:
@@ -119,3 +127,42 @@ class LLMCache:
         with open(tmp, "w", encoding="utf-8") as f:
             json.dump(payload, f, ensure_ascii=False, indent=2)
         tmp.replace(path)
+
+
+class PromptCache:
+    """Content-addressed response cache under <cache_root>/<namespace>/by_prompt/.
+
+    The key is a stable hash of everything that determines the provider's
+    output (provider plus the exact rendered request: model, limits and
+    prompt text), so a hit is an exact-input match and needs no further
+    signature checks.
+    """
+
+    def __init__(self, cache_root: Path | None, namespace: str):
+        self.dir: Path | None = (cache_root / namespace / "by_prompt") if cache_root else None
+
+    @property
+    def enabled(self) -> bool:
+        return self.dir is not None
+
+    def load(self, key: str) -> dict | None:
+        if not self.dir:
+            return None
+        path = self.dir / f"{key}.json"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def save(self, key: str, response: dict) -> None:
+        if not self.dir:
+            return
+        self.dir.mkdir(parents=True, exist_ok=True)
+        path = self.dir / f"{key}.json"
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(response, f, ensure_ascii=False)
+        tmp.replace(path)
@@ -0,0 +1,23 @@
+"""Process pools that are safe to start from a multi-threaded pipeline.
+
+Stages start their CPU pools while other threads are busy: clone threads,
+the video branch's download and Gemini workers, tqdm's monitor. Forking a
+process in that state copies whatever locks those threads held, and a child
+that touches one deadlocks. Workers are started from a clean forkserver (or
+spawned, where forkserver isn't available) instead of forked.
+
+As with any non-fork start method, a script that runs a stage directly
+needs an `if __name__ == "__main__":` guard; the console script and the
+API server already have one.
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+def process_pool(max_workers: int | None = None) -> ProcessPoolExecutor:
+    """A ProcessPoolExecutor whose workers are never forked from this process."""
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
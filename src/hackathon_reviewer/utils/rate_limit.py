@@ -0,0 +1,103 @@
+"""Proactive per-minute rate limiting for LLM fan-out.
+
+Providers enforce requests-per-minute and input-tokens-per-minute quotas by
+rejecting overage with 429s, and the SDKs answer those with exponential
+backoff. With a few hundred reviews in flight that turns into retry storms
+and wasted wall time. Instead we hold each request until both budgets can
+cover it, then refund the difference once the real token count is known.
+
+Limits of 0 disable the corresponding bucket.
+
+Code review fans out on an event loop and uses the asyncio buckets; video
+analysis runs on a thread pool and shares one `BlockingTokenBucket`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """Continuous-refill bucket holding up to `per_minute` units."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.refill_per_sec = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+        self.updated = now
+
+    async def acquire(self, n: float) -> None:
+        """Wait until `n` units are available and take them.
+
+        Requests larger than the whole bucket are clamped to its capacity so
+        one oversized prompt can't block forever. Waiters are served in
+        arrival order: the lock is held while sleeping.
+        """
+        n = min(n, self.capacity)
+        async with self._lock:
+            self._refill()
+            while self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.refill_per_sec)
+                self._refill()
+            self.tokens -= n
+
+    def refund(self, n: float) -> None:
+        """Return `n` units (negative to charge extra) after the fact."""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens + n)
+
+
+class LLMRateLimiter:
+    """Request + input-token budgets shared by every call on one event loop."""
+
+    def __init__(self, requests_per_minute: int = 0, tokens_per_minute: int = 0):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+
+    async def acquire(self, estimated_tokens: int) -> None:
+        if self.requests is not None:
+            await self.requests.acquire(1)
+        if self.tokens is not None:
+            await self.tokens.acquire(estimated_tokens)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the provider reports real usage."""
+        if self.tokens is not None and actual_tokens > 0:
+            self.tokens.refund(estimated_tokens - actual_tokens)
+
+
+class BlockingTokenBucket:
+    """Thread-safe `TokenBucket` for work fanned out on a thread pool."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.refill_per_sec = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.refill_per_sec)
+        self.updated = now
+
+    def acquire(self, n: float = 1) -> None:
+        """Block until `n` units are available and take them.
+
+        Same clamping and arrival-order guarantees as `TokenBucket.acquire`.
+        """
+        n = min(n, self.capacity)
+        with self._lock:
+            self._refill()
+            while self.tokens < n:
+                time.sleep((n - self.tokens) / self.refill_per_sec)
+                self._refill()
+            self.tokens -= n
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+import json
 import os
+import re
+import shutil
 import subprocess
+import threading
+from functools import lru_cache
 from pathlib import Path
 
 DOWNLOAD_TIMEOUT = 300
@@ -31,11 +36,21 @@ def download_ytdlp(url: str, output_path: Path) -> tuple[bool, str | None]:
         cmd = [
             "yt-dlp",
             "--no-playlist",
+            "--no-progress",
             "--max-filesize", "500M",
             "--merge-output-format", "mp4",
             "-o", str(output_path),
             "--socket-timeout", "30",
+            # Fetch HLS/DASH fragments in parallel instead of one at a time.
+            "--concurrent-fragments", "4",
         ]
+        # Direct media files arrive as one big HTTP download; aria2c splits
+        # it across connections when installed.
+        if shutil.which("aria2c"):
+            cmd += [
+                "--downloader", "aria2c",
+                "--downloader-args", "aria2c:-x16 -s16 -k1M --console-log-level=warn",
+            ]
         # Optional: handle age-restricted / sign-in-required videos by
         # passing cookies. Two ways:
         # 1) YTDLP_COOKIES_FILE=/path/to/cookies.txt — Netscape-format
@@ -51,10 +66,16 @@ def download_ytdlp(url: str, output_path: Path) -> tuple[bool, str | None]:
         elif cookies_browser:
             cmd += ["--cookies-from-browser", cookies_browser]
         cmd.append(url)
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=DOWNLOAD_TIMEOUT)
+        # Progress lines go to stdout and are never read, so don't buffer
+        # them; with --no-progress stderr is only warnings and errors, and
+        # the final ERROR line is at the end.
+        proc = subprocess.run(
+            cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, timeout=DOWNLOAD_TIMEOUT,
+        )
         if proc.returncode == 0 and output_path.exists():
             return True, None
-        return False, (proc.stderr.strip()[:300] if proc.stderr else "download_failed")
+        return False, (proc.stderr.strip()[-300:] if proc.stderr else "download_failed")
     except subprocess.TimeoutExpired:
         return False, "download_timeout"
     except FileNotFoundError:
@@ -63,6 +84,11 @@ def download_ytdlp(url: str, output_path: Path) -> tuple[bool, str | None]:
         return False, str(e)[:200]
 
 
+# Drive file ids in /file/d/<id>/view, open?id=<id> / uc?id=<id>, and the
+# short /d/<id> forms. Stops at the id so trailing ?usp=sharing doesn't stick.
+_DRIVE_ID_RE = re.compile(r"(?:/file/d/|[?&]id=|/d/)([A-Za-z0-9_-]+)")
+
+
 def download_gdown(url: str, output_path: Path) -> tuple[bool, str | None]:
     """Download a Google Drive video using gdown. Returns (success, error)."""
     if "/folders/" in url.lower():
@@ -75,13 +101,8 @@ def download_gdown(url: str, output_path: Path) -> tuple[bool, str | None]:
     try:
         import gdown
 
-        file_id = None
-        if "/file/d/" in url:
-            file_id = url.split("/file/d/")[1].split("/")[0]
-        elif "id=" in url:
-            file_id = url.split("id=")[1].split("&")[0]
-        elif "/d/" in url:
-            file_id = url.split("/d/")[1].split("/")[0]
+        m = _DRIVE_ID_RE.search(url)
+        file_id = m.group(1) if m else None
 
         if not file_id:
             return False, "could_not_extract_drive_file_id"
@@ -96,69 +117,114 @@ def download_gdown(url: str, output_path: Path) -> tuple[bool, str | None]:
         return False, str(e)[:200]
 
 
-def get_video_duration(video_path: Path) -> float:
-    """Get video duration in seconds using ffprobe."""
+@lru_cache(maxsize=4096)
+def _probe_cached(path: str, mtime_ns: int, size: int) -> tuple[float, int]:
+    """(duration seconds, first video stream height) from a single ffprobe.
+
+    Keyed on mtime and size as well as the path, so a re-downloaded or
+    re-encoded file is probed again. Failed fields come back as 0.
+    """
+    duration, height = 0.0, 0
     try:
         cmd = [
             "ffprobe", "-v", "quiet",
-            "-show_entries", "format=duration",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path),
+            "-select_streams", "v:0",
+            "-show_entries", "format=duration:stream=height",
+            "-of", "json",
+            path,
         ]
         result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
         if result.returncode == 0:
-            return float(result.stdout.strip())
+            info = json.loads(result.stdout)
+            try:
+                duration = float(info.get("format", {}).get("duration", 0.0))
+            except (TypeError, ValueError):
+                pass
+            streams = info.get("streams") or []
+            if streams:
+                height = int(streams[0].get("height") or 0)
     except Exception:
         pass
-    return 0.0
+    return duration, height
+
+
+def _probe(video_path: Path) -> tuple[float, int]:
+    try:
+        st = os.stat(video_path)
+    except OSError:
+        return 0.0, 0
+    return _probe_cached(str(video_path), st.st_mtime_ns, st.st_size)
+
+
+def get_video_duration(video_path: Path) -> float:
+    """Get video duration in seconds using ffprobe."""
+    return _probe(video_path)[0]
 
 
-def prepare_video_for_upload(video_path: Path, max_duration: int = 300) -> Path:
+# ffmpeg threads per re-encode; parallelism comes from running several.
+FFMPEG_THREADS = 2
+
+
+@lru_cache(maxsize=None)
+def _prep_slots(workers: int) -> threading.Semaphore:
+    """Shared cap on concurrent ffmpeg runs (0 = half the CPUs)."""
+    if workers <= 0:
+        workers = max(1, (os.cpu_count() or 2) // FFMPEG_THREADS)
+    return threading.Semaphore(workers)
+
+
+def prepare_video_for_upload(
+    video_path: Path, max_duration: int = 300, workers: int = 0,
+) -> Path:
     """Trim to max_duration and downscale to 720p for faster Gemini upload.
 
     Returns the path to the prepared file (may be original if no processing needed,
     or a new _prepared.mp4 file).
+
+    At most `workers` ffmpeg runs (0 = half the CPUs) go at once across all
+    threads, each with FFMPEG_THREADS threads, so an analysis pool wider than
+    the machine doesn't oversubscribe the CPU with re-encodes.
     """
     prepared_path = video_path.with_name(video_path.stem + "_prepared.mp4")
     if prepared_path.exists() and prepared_path.stat().st_size > 0:
         return prepared_path
 
-    duration = get_video_duration(video_path)
+    duration, height = _probe(video_path)
     needs_trim = duration > max_duration
-    needs_scale = _video_height(video_path) > 720
+    needs_scale = height > 720
 
     if not needs_trim and not needs_scale:
         return video_path
 
-    try:
-        cmd = ["ffmpeg", "-i", str(video_path)]
-        if needs_trim:
-            cmd += ["-t", str(max_duration)]
-        if needs_scale:
-            cmd += ["-vf", "scale=-2:720"]
-        cmd += ["-c:a", "aac", "-b:a", "128k", "-y", str(prepared_path)]
-        proc = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
-        if proc.returncode == 0 and prepared_path.exists():
-            return prepared_path
-    except Exception:
-        pass
+    # A trim alone doesn't need a re-encode: stream-copying cuts at the
+    # nearest keyframe, which is close enough for a demo cap, and is IO-bound
+    # instead of CPU-bound. Streams mp4 can't hold fall back to the re-encode.
+    attempts = []
+    if not needs_scale:
+        attempts.append(["-t", str(max_duration), "-c", "copy", "-avoid_negative_ts", "make_zero"])
+    reencode = ["-t", str(max_duration)] if needs_trim else []
+    if needs_scale:
+        reencode += ["-vf", "scale=-2:720"]
+    attempts.append(reencode + ["-c:a", "aac", "-b:a", "128k"])
+
+    with _prep_slots(workers):
+        for args in attempts:
+            try:
+                cmd = ["ffmpeg", "-i", str(video_path), *args, "-threads", str(FFMPEG_THREADS),
+                       "-movflags", "+faststart", "-y", str(prepared_path)]
+                # Only the exit code matters; don't buffer ffmpeg's progress log.
+                proc = subprocess.run(
+                    cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=120,
+                )
+                if proc.returncode == 0 and prepared_path.exists() and prepared_path.stat().st_size > 0:
+                    return prepared_path
+            except Exception:
+                pass
+        prepared_path.unlink(missing_ok=True)
 
     return video_path
 
 
 def _video_height(video_path: Path) -> int:
     """Get video height in pixels using ffprobe."""
-    try:
-        cmd = [
-            "ffprobe", "-v", "quiet",
-            "-select_streams", "v:0",
-            "-show_entries", "stream=height",
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            str(video_path),
-        ]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode == 0 and result.stdout.strip():
-            return int(result.stdout.strip())
-    except Exception:
-        pass
-    return 0
+    return _probe(video_path)[1]
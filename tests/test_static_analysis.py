@@ -0,0 +1,73 @@
+"""Tests for the static-analysis literal prefilter."""
+
+import re
+
+import pytest
+
+from hackathon_reviewer.stages.static_analysis import _required_literals
+
+# (pattern, expected literals, expected is_pure)
+CASES = [
+    # Plain literals and escaped punctuation
+    ("openai", ("openai",), True),
+    ("Anthropic", ("anthropic",), True),
+    (r"open\.ai", ("open.ai",), True),
+    (r"client\(", ("client(",), True),
+    # Alphanumeric escapes end the run and are consumed whole
+    (r"\x41nthropic", ("nthropic",), False),
+    (r"open\x61i", ("open", "i"), False),
+    (r"\u0041nthropic", ("nthropic",), False),
+    (r"\U00000041nthropic", ("nthropic",), False),
+    (r"x\N{DIGIT ONE}yz", ("yz", "x"), False),
+    (r"\101BC", ("bc",), False),
+    (r"\0777", ("7",), False),
+    (r"\0", (), False),
+    (r"(a)\1bc", ("bc",), False),
+    (r"(a)(b)(c)(d)(e)(f)(g)(h)(i)(j)\10x", ("x",), False),
+    (r"anthropic\s*\(", ("anthropic", "("), False),
+    (r"\bopenai\b", ("openai",), False),
+    (r"\d+tokens", ("tokens",), False),
+    # Quantifiers make the preceding character optional
+    ("colou?r", ("colo", "r"), False),
+    ("ab*c", ("a", "c"), False),
+    ("ab+c", ("a", "c"), False),
+    ("ab{2,3}c", ("a", "c"), False),
+    ("ab*?c", ("a", "c"), False),
+    (r"\x41?bc", ("bc",), False),
+    # Groups and classes contribute nothing
+    ("(?:gpt|claude)-4", ("-4",), False),
+    ("ab(cd)?ef", ("ab", "ef"), False),
+    ("[Oo]pen[Aa][Ii]", ("pen",), False),
+    (r"[\]x]yz", ("yz",), False),
+    ("[]a]bc", ("bc",), False),
+    ("[^]a]bc", ("bc",), False),
+    # Inline flags
+    ("(?i)openai", ("openai",), False),
+    ("(?s)a.b", ("a", "b"), False),
+    ("(?x)open ai", (), False),
+    # Top-level alternation and non-ASCII give up
+    ("openai|anthropic", (), False),
+    ("café", (), False),
+]
+
+
+@pytest.mark.parametrize("pattern,literals,pure", CASES)
+def test_required_literals(pattern, literals, pure):
+    assert _required_literals(pattern) == (literals, pure)
+
+
+@pytest.mark.parametrize("pattern", [p for p, _, _ in CASES])
+def test_literals_never_reject_a_match(pattern):
+    samples = [
+        "Anthropic()", "from openai import OpenAI", "open.ai", "colour color",
+        "abbc ac", "gpt-4 claude-4", "AAbc BC", "\x07\x3f7", "x1yz",
+        "aabc a8", "12 tokens", "[x]yz ]bc", "café", "a\nb", "abcdef abef",
+    ]
+    literals, pure = _required_literals(pattern)
+    regex = re.compile(pattern, re.IGNORECASE)
+    for text in samples:
+        found = regex.findall(text)
+        if found:
+            assert all(lit in text.lower() for lit in literals), (pattern, text)
+        if pure and literals:
+            assert text.lower().count(literals[0]) == len(found), (pattern, text)